@@ -4,45 +4,83 @@ Examine events that have no title (SUMMARY field) in an ICS file.
 """
 
 import sys
+from collections import Counter
 from datetime import datetime, date
-from icalendar import Calendar
+from typing import Iterator
+from icalendar import Component
+
+from ics_common import iter_ics_blocks, strip_mailto
+
+# Read buffer for ICS exports (often tens to hundreds of MB)
+READ_BUFFER_SIZE = 1024 * 1024
+
+
+def iter_vevents(ics_path: str) -> Iterator[Component]:
+    """Parse an ICS file one VEVENT at a time instead of as a whole Calendar"""
+    with open(ics_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        for name, raw in iter_ics_blocks(f):
+            if name == 'VTIMEZONE':
+                # Registers the TZID before the events that reference it
+                try:
+                    Component.from_ical(raw)
+                except Exception:
+                    pass
+            elif name == 'VEVENT':
+                yield Component.from_ical(raw)
+
 
 def examine_no_title_events(ics_path: str, max_events: int = 20):
     """Find and display details of events without titles"""
     
     print(f"Examining events without titles in: {ics_path}\n")
     
-    with open(ics_path, 'rb') as f:
-        cal = Calendar.from_ical(f.read())
-    
-    no_title_events = []
+    no_title_events = []  # only the first max_events, for the samples below
+    no_title_count = 0
     total_events = 0
+    class_counts = Counter()
+    busy_counts = Counter()
+    with_desc = 0
+    with_attendees = 0
+    with_organizer = 0
     
-    for component in cal.walk():
-        if component.name == "VEVENT":
-            total_events += 1
-            summary = component.get('summary')
+    for component in iter_vevents(ics_path):
+        total_events += 1
+        summary = component.get('summary')
+        
+        # Check if no title or empty title
+        if not summary or str(summary).strip() == '':
+            no_title_count += 1
             
-            # Check if no title or empty title
-            if not summary or str(summary).strip() == '':
-                event_info = {
+            # Tally patterns as we go rather than re-reading a full list later
+            cls = component.get('class')
+            class_counts[str(cls).upper() if cls else 'NONE'] += 1
+            busy = component.get('x-microsoft-cdo-busystatus')
+            busy_counts[str(busy).upper() if busy else 'NONE'] += 1
+            description = component.get('description')
+            attendee = component.get('attendee')
+            organizer = component.get('organizer')
+            with_desc += bool(description)
+            with_attendees += bool(attendee)
+            with_organizer += bool(organizer)
+            
+            if len(no_title_events) < max_events:
+                no_title_events.append({
                     'summary': summary,
                     'dtstart': component.get('dtstart'),
                     'dtend': component.get('dtend'),
-                    'description': component.get('description'),
+                    'description': description,
                     'location': component.get('location'),
-                    'organizer': component.get('organizer'),
-                    'attendee': component.get('attendee'),
-                    'class': component.get('class'),
+                    'organizer': organizer,
+                    'attendee': attendee,
+                    'class': cls,
                     'transp': component.get('transp'),
                     'status': component.get('status'),
-                    'busystatus': component.get('x-microsoft-cdo-busystatus'),
+                    'busystatus': busy,
                     'uid': component.get('uid'),
-                }
-                no_title_events.append(event_info)
+                })
     
     print(f"Total events: {total_events}")
-    print(f"Events without title: {len(no_title_events)} ({len(no_title_events)/total_events*100:.1f}%)")
+    print(f"Events without title: {no_title_count} ({no_title_count/total_events*100:.1f}%)")
     print("=" * 70)
     
     # Analyze patterns
@@ -50,96 +88,88 @@ def examine_no_title_events(ics_path: str, max_events: int = 20):
     print("-" * 40)
     
     # Check class (public/private)
-    class_counts = {}
-    for e in no_title_events:
-        cls = str(e['class']).upper() if e['class'] else 'NONE'
-        class_counts[cls] = class_counts.get(cls, 0) + 1
     print(f"By visibility (CLASS):")
-    for cls, count in sorted(class_counts.items(), key=lambda x: -x[1]):
+    for cls, count in class_counts.most_common():
         print(f"  - {cls}: {count}")
     
     # Check busy status
-    busy_counts = {}
-    for e in no_title_events:
-        busy = str(e['busystatus']).upper() if e['busystatus'] else 'NONE'
-        busy_counts[busy] = busy_counts.get(busy, 0) + 1
     print(f"\nBy busy status:")
-    for busy, count in sorted(busy_counts.items(), key=lambda x: -x[1]):
+    for busy, count in busy_counts.most_common():
         print(f"  - {busy}: {count}")
     
     # Check if they have descriptions
-    with_desc = sum(1 for e in no_title_events if e['description'])
     print(f"\nWith description: {with_desc}")
-    print(f"Without description: {len(no_title_events) - with_desc}")
+    print(f"Without description: {no_title_count - with_desc}")
     
     # Check if they have attendees
-    with_attendees = sum(1 for e in no_title_events if e['attendee'])
     print(f"\nWith attendees: {with_attendees}")
-    print(f"Without attendees: {len(no_title_events) - with_attendees}")
+    print(f"Without attendees: {no_title_count - with_attendees}")
     
     # Check if they have organizer
-    with_organizer = sum(1 for e in no_title_events if e['organizer'])
     print(f"\nWith organizer: {with_organizer}")
-    print(f"Without organizer: {len(no_title_events) - with_organizer}")
+    print(f"Without organizer: {no_title_count - with_organizer}")
     
     # Show samples
     print("\n" + "=" * 70)
-    print(f"SAMPLE EVENTS (showing first {min(max_events, len(no_title_events))} of {len(no_title_events)}):")
+    print(f"SAMPLE EVENTS (showing first {len(no_title_events)} of {no_title_count}):")
     print("=" * 70)
     
-    for i, event in enumerate(no_title_events[:max_events], 1):
-        print(f"\n--- Event {i} ---")
+    for i, event in enumerate(no_title_events, 1):
+        # Collected and written once per event instead of once per field
+        lines = [f"\n--- Event {i} ---"]
         
         # Start/End
         if event['dtstart']:
             dt = event['dtstart'].dt
             if isinstance(dt, datetime):
-                print(f"  Start:       {dt.strftime('%Y-%m-%d %H:%M %Z')}")
+                lines.append(f"  Start:       {dt.strftime('%Y-%m-%d %H:%M %Z')}")
             else:
-                print(f"  Start:       {dt} (all-day)")
+                lines.append(f"  Start:       {dt} (all-day)")
         
         if event['dtend']:
             dt = event['dtend'].dt
             if isinstance(dt, datetime):
-                print(f"  End:         {dt.strftime('%Y-%m-%d %H:%M %Z')}")
+                lines.append(f"  End:         {dt.strftime('%Y-%m-%d %H:%M %Z')}")
             else:
-                print(f"  End:         {dt} (all-day)")
+                lines.append(f"  End:         {dt} (all-day)")
         
         # Other fields
         if event['class']:
-            print(f"  Visibility:  {event['class']}")
+            lines.append(f"  Visibility:  {event['class']}")
         
         if event['busystatus']:
-            print(f"  Busy status: {event['busystatus']}")
+            lines.append(f"  Busy status: {event['busystatus']}")
         
         if event['transp']:
-            print(f"  Show as:     {event['transp']}")
+            lines.append(f"  Show as:     {event['transp']}")
         
         if event['location']:
-            loc = str(event['location'])[:80]
-            print(f"  Location:    {loc}{'...' if len(str(event['location'])) > 80 else ''}")
+            loc = str(event['location'])
+            lines.append(f"  Location:    {loc[:80]}{'...' if len(loc) > 80 else ''}")
         
         if event['organizer']:
-            org = str(event['organizer']).replace('mailto:', '').replace('MAILTO:', '')
-            print(f"  Organizer:   {org}")
+            org = strip_mailto(str(event['organizer']))
+            lines.append(f"  Organizer:   {org}")
         
         if event['attendee']:
             attendees = event['attendee']
             if not isinstance(attendees, list):
                 attendees = [attendees]
-            print(f"  Attendees:   {len(attendees)}")
+            lines.append(f"  Attendees:   {len(attendees)}")
             for att in attendees[:3]:
-                email = str(att).replace('mailto:', '').replace('MAILTO:', '')
-                print(f"               - {email}")
+                email = strip_mailto(str(att))
+                lines.append(f"               - {email}")
             if len(attendees) > 3:
-                print(f"               ... and {len(attendees) - 3} more")
+                lines.append(f"               ... and {len(attendees) - 3} more")
         
         if event['description']:
-            desc = str(event['description'])[:200]
-            print(f"  Description: {desc}{'...' if len(str(event['description'])) > 200 else ''}")
+            desc = str(event['description'])
+            lines.append(f"  Description: {desc[:200]}{'...' if len(desc) > 200 else ''}")
         
         if event['uid']:
-            print(f"  UID:         {str(event['uid'])[:60]}...")
+            lines.append(f"  UID:         {str(event['uid'])[:60]}...")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
@@ -7,6 +7,7 @@ Useful for understanding the structure and contents of Outlook calendar exports.
 
 Requirements:
     pip install icalendar python-dateutil
+    pip install orjson  # optional, faster --json output
 
 Usage:
     python ics_analyzer.py <ics_file_or_directory>
@@ -19,30 +20,62 @@ import sys
 import argparse
 import json
 from pathlib import Path
-from datetime import datetime, timedelta, date
-from typing import Optional, List, Dict, Any, Set, Tuple
+from datetime import datetime, timedelta, date, time
+from typing import Optional, List, Dict, DefaultDict, Any, Set, Tuple, BinaryIO
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from dataclasses import dataclass, field
 
-from icalendar import Calendar, Event
+from icalendar import Calendar, Component, Event
 from dateutil import tz as dateutil_tz
 
+from ics_common import iter_ics_blocks, strip_mailto
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Read buffer for ICS exports (often tens to hundreds of MB)
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Files larger than this are parsed one component at a time instead of
+# building the whole Calendar tree in memory
+STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Start of day used to place all-day events on the date range
+_MIDNIGHT = time(0, 0)
+
 
 @dataclass
 class FieldStats:
     """Statistics for a single field"""
     count: int = 0
     sample_values: List[str] = field(default_factory=list)
-    unique_values: Set[str] = field(default_factory=set)
+    # Mirrors sample_values for constant-time dedup; not part of any report
+    _sample_set: Set[str] = field(default_factory=set, repr=False)
     
     def add(self, value: str, max_samples: int = 5):
         self.count += 1
         if len(self.sample_values) < max_samples:
             # Truncate long values for display
-            display_val = str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-            if display_val not in self.sample_values:
+            str_value = str(value)
+            display_val = str_value[:100] + "..." if len(str_value) > 100 else str_value
+            if display_val not in self._sample_set:
+                self._sample_set.add(display_val)
+                self.sample_values.append(display_val)
+    
+    def merge(self, other: 'FieldStats', max_samples: int = 5):
+        """Fold another FieldStats for the same field into this one"""
+        self.count += other.count
+        for display_val in other.sample_values:
+            if len(self.sample_values) >= max_samples:
+                break
+            if display_val not in self._sample_set:
+                self._sample_set.add(display_val)
                 self.sample_values.append(display_val)
-        self.unique_values.add(str(value)[:200])
 
 
 @dataclass 
@@ -63,7 +96,7 @@ class AnalysisReport:
     latest_event: Optional[datetime] = None
     
     # Field presence
-    fields: Dict[str, FieldStats] = field(default_factory=dict)
+    fields: DefaultDict[str, FieldStats] = field(default_factory=lambda: defaultdict(FieldStats))
     
     # Attendee stats
     events_with_attendees: int = 0
@@ -92,6 +125,63 @@ class AnalysisReport:
     
     # Sample events
     sample_events: List[Dict[str, Any]] = field(default_factory=list)
+    
+    # (total_events, file_count) -> fields sorted by count, see sorted_fields
+    _sorted_fields_cache: Optional[Tuple[Tuple[int, int], List]] = field(default=None, repr=False)
+    
+    # Plain counters summed by merge()
+    _COUNTS = (
+        'file_count', 'total_size_bytes', 'total_events',
+        'all_day_events', 'timed_events', 'recurring_events', 'cancelled_events',
+        'events_with_attendees', 'total_attendees', 'events_with_organizer',
+        'events_with_exceptions', 'events_with_reminders',
+    )
+    
+    @property
+    def sorted_fields(self) -> List[Tuple[str, FieldStats, float]]:
+        """(name, stats, percent of events) for each field, most common first"""
+        key = (self.total_events, self.file_count)
+        if self._sorted_fields_cache is None or self._sorted_fields_cache[0] != key:
+            total = self.total_events
+            ranked = [
+                (name, stats, stats.count * 100.0 / total if total else 0.0)
+                for name, stats in sorted(self.fields.items(), key=lambda x: -x[1].count)
+            ]
+            self._sorted_fields_cache = (key, ranked)
+        return self._sorted_fields_cache[1]
+    
+    def merge(self, other: 'AnalysisReport', max_samples: int = 5) -> None:
+        """Fold the report for another file into this one"""
+        for name in self._COUNTS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        
+        # Mixed naive/aware datetimes can't be compared - keep what we have
+        try:
+            if other.earliest_event is not None and (
+                    self.earliest_event is None or other.earliest_event < self.earliest_event):
+                self.earliest_event = other.earliest_event
+            if other.latest_event is not None and (
+                    self.latest_event is None or other.latest_event > self.latest_event):
+                self.latest_event = other.latest_event
+        except TypeError:
+            pass
+        
+        for name, stats in other.fields.items():
+            self.fields[name].merge(stats)
+        
+        self.unique_attendees |= other.unique_attendees
+        self.unique_organizers |= other.unique_organizers
+        self.attendee_response_stats.update(other.attendee_response_stats)
+        self.recurrence_types.update(other.recurrence_types)
+        self.reminder_types.update(other.reminder_types)
+        self.timezones_found.update(other.timezones_found)
+        
+        self.issues.extend(other.issues)
+        for warning in other.warnings:
+            if warning not in self.warnings:
+                self.warnings.append(warning)
+        
+        self.sample_events.extend(other.sample_events[:max_samples - len(self.sample_events)])
 
 
 class ICSAnalyzer:
@@ -107,6 +197,8 @@ class ICSAnalyzer:
         'x-microsoft-disallow-counter', 'x-microsoft-skypeteamsmeetingurl',
         'x-alt-desc'
     ]
+    # Interned so the per-event field keys hash and compare by identity
+    TRACKED_FIELDS_SET = frozenset(sys.intern(f.lower()) for f in TRACKED_FIELDS)
     
     # Known Windows/Outlook timezone names
     WINDOWS_TIMEZONES = {
@@ -120,31 +212,58 @@ class ICSAnalyzer:
     
     def __init__(self):
         self.report = AnalysisReport()
+        self._windows_tz_warned = False
     
     def analyze_file(self, ics_path: str, max_samples: int = 5) -> None:
         """Analyze a single ICS file"""
         self.report.file_count += 1
-        file_size = os.path.getsize(ics_path)
-        self.report.total_size_bytes += file_size
-        
-        print(f"Analyzing: {ics_path} ({file_size / 1024 / 1024:.2f} MB)")
         
-        with open(ics_path, 'rb') as f:
+        with open(ics_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            # Size from the open descriptor - no separate path stat
+            file_size = os.fstat(f.fileno()).st_size
+            self.report.total_size_bytes += file_size
+            
+            print(f"Analyzing: {ics_path} ({file_size / 1024 / 1024:.2f} MB)")
+            
+            if file_size > STREAM_THRESHOLD_BYTES:
+                self._analyze_stream(f, ics_path, max_samples)
+                return
+            
             try:
                 cal = Calendar.from_ical(f.read())
             except Exception as e:
                 self.report.issues.append(f"Failed to parse {ics_path}: {e}")
                 return
         
-        # Check calendar-level properties
-        for component in cal.walk():
-            if component.name == "VCALENDAR":
-                self._analyze_calendar_props(component)
-            elif component.name == "VTIMEZONE":
+        # Check calendar-level properties, then its direct components
+        self._analyze_calendar_props(cal)
+        for component in cal.subcomponents:
+            if component.name == "VTIMEZONE":
                 self._analyze_timezone(component)
             elif component.name == "VEVENT":
                 self._analyze_event(component, max_samples)
     
+    def _analyze_stream(self, f: BinaryIO, ics_path: str, max_samples: int) -> None:
+        """Analyze a large ICS file one top-level component at a time"""
+        for name, raw in iter_ics_blocks(f):
+            if name not in ('VCALENDAR', 'VTIMEZONE', 'VEVENT'):
+                continue
+            
+            # VTIMEZONE blocks must still be parsed so their TZIDs are
+            # registered before the events that reference them
+            try:
+                component = Component.from_ical(raw)
+            except Exception as e:
+                self.report.issues.append(f"Failed to parse {name} in {ics_path}: {e}")
+                continue
+            
+            if name == "VCALENDAR":
+                self._analyze_calendar_props(component)
+            elif name == "VTIMEZONE":
+                self._analyze_timezone(component)
+            else:
+                self._analyze_event(component, max_samples)
+    
     def _analyze_calendar_props(self, cal) -> None:
         """Analyze calendar-level properties"""
         prodid = cal.get('prodid')
@@ -158,17 +277,18 @@ class ICSAnalyzer:
         x_wr_timezone = cal.get('x-wr-timezone')
         if x_wr_timezone:
             self._add_field('x-wr-timezone', str(x_wr_timezone))
-            self.report.timezones_found[str(x_wr_timezone)] += 1
+            self.report.timezones_found[sys.intern(str(x_wr_timezone))] += 1
     
     def _analyze_timezone(self, tz_component) -> None:
         """Analyze VTIMEZONE components"""
         tzid = tz_component.get('tzid')
         if tzid:
-            self.report.timezones_found[str(tzid)] += 1
+            self.report.timezones_found[sys.intern(str(tzid))] += 1
             
             # Check if it's a Windows timezone
             if str(tzid) in self.WINDOWS_TIMEZONES:
-                if "Windows/Outlook timezone detected" not in self.report.warnings:
+                if not self._windows_tz_warned:
+                    self._windows_tz_warned = True
                     self.report.warnings.append(
                         "Windows/Outlook timezone names detected - will be converted to IANA format during import"
                     )
@@ -178,26 +298,26 @@ class ICSAnalyzer:
         self.report.total_events += 1
         event_data = {}
         
-        # Track all present fields
-        for field_name in self.TRACKED_FIELDS:
-            value = vevent.get(field_name)
-            if value is not None:
-                self._add_field(field_name, value)
-                event_data[field_name] = str(value)[:100]
-        
-        # Also check for any X- (extended) properties we might have missed
-        for key in vevent.keys():
+        # Track all present fields (and any X- extended properties) in a
+        # single pass, keeping the raw values we need further down
+        props = {}
+        for key, value in vevent.items():
             key_lower = key.lower()
-            if key_lower.startswith('x-') and key_lower not in [f.lower() for f in self.TRACKED_FIELDS]:
-                self._add_field(key_lower, vevent.get(key))
+            if key_lower in self.TRACKED_FIELDS_SET:
+                self._add_field(key_lower, value)
+                event_data[key_lower] = str(value)[:100]
+                props[key_lower] = value
+            elif key_lower.startswith('x-'):
+                self._add_field(key_lower, value)
         
         # Analyze start/end times
-        dtstart = vevent.get('dtstart')
+        dtstart = props.get('dtstart')
         if dtstart:
             start_dt = dtstart.dt
             
-            # Check if all-day or timed
-            if isinstance(start_dt, date) and not isinstance(start_dt, datetime):
+            # Check if all-day or timed (icalendar gives a plain date for all-day)
+            is_all_day = type(start_dt) is date
+            if is_all_day:
                 self.report.all_day_events += 1
                 event_data['_type'] = 'all-day'
             else:
@@ -208,14 +328,14 @@ class ICSAnalyzer:
                 if hasattr(dtstart, 'params'):
                     tzid = dtstart.params.get('TZID')
                     if tzid:
-                        self.report.timezones_found[str(tzid)] += 1
+                        self.report.timezones_found[sys.intern(str(tzid))] += 1
             
             # Track date range
             try:
-                if isinstance(start_dt, datetime):
-                    compare_dt = start_dt
+                if is_all_day:
+                    compare_dt = datetime.combine(start_dt, _MIDNIGHT)
                 else:
-                    compare_dt = datetime.combine(start_dt, datetime.min.time())
+                    compare_dt = start_dt
                 
                 if self.report.earliest_event is None or compare_dt < self.report.earliest_event:
                     self.report.earliest_event = compare_dt
@@ -225,42 +345,40 @@ class ICSAnalyzer:
                 pass
         
         # Check for recurrence
-        rrule = vevent.get('rrule')
+        rrule = props.get('rrule')
         if rrule:
             self.report.recurring_events += 1
-            rrule_str = rrule.to_ical().decode('utf-8')
             
-            # Parse recurrence frequency
-            if 'FREQ=DAILY' in rrule_str:
-                self.report.recurrence_types['DAILY'] += 1
-            elif 'FREQ=WEEKLY' in rrule_str:
-                self.report.recurrence_types['WEEKLY'] += 1
-            elif 'FREQ=MONTHLY' in rrule_str:
-                self.report.recurrence_types['MONTHLY'] += 1
-            elif 'FREQ=YEARLY' in rrule_str:
-                self.report.recurrence_types['YEARLY'] += 1
+            # Recurrence frequency (vRecur keeps FREQ as a list)
+            freq = rrule.get('FREQ')
+            if freq:
+                self.report.recurrence_types[str(freq[0]).upper()] += 1
             
             # Check for exceptions
-            if vevent.get('exdate'):
+            if props.get('exdate'):
                 self.report.events_with_exceptions += 1
         
         # Check status
-        status = vevent.get('status')
+        status = props.get('status')
         if status and str(status).upper() == 'CANCELLED':
             self.report.cancelled_events += 1
         
         # Analyze attendees
-        attendees = vevent.get('attendee')
-        if attendees:
-            if not isinstance(attendees, list):
-                attendees = [attendees]
-            
+        # (a single ATTENDEE comes back bare rather than in a list)
+        attendee_value = props.get('attendee')
+        if isinstance(attendee_value, list):
+            attendees = attendee_value
+        else:
+            attendees = (attendee_value,) if attendee_value else ()
+        
+        attendee_count = len(attendees)
+        if attendee_count:
             self.report.events_with_attendees += 1
+            self.report.total_attendees += attendee_count
             
             for attendee in attendees:
-                self.report.total_attendees += 1
-                email = str(attendee).replace('mailto:', '').replace('MAILTO:', '')
-                self.report.unique_attendees.add(email.lower())
+                email = strip_mailto(str(attendee)).lower()
+                self.report.unique_attendees.add(email)
                 
                 # Track response status
                 if hasattr(attendee, 'params'):
@@ -268,15 +386,15 @@ class ICSAnalyzer:
                     self.report.attendee_response_stats[str(partstat).upper()] += 1
         
         # Analyze organizer
-        organizer = vevent.get('organizer')
+        organizer = props.get('organizer')
         if organizer:
             self.report.events_with_organizer += 1
-            org_email = str(organizer).replace('mailto:', '').replace('MAILTO:', '')
-            self.report.unique_organizers.add(org_email.lower())
+            org_email = strip_mailto(str(organizer)).lower()
+            self.report.unique_organizers.add(org_email)
         
         # Analyze reminders/alarms
         has_alarm = False
-        for component in vevent.walk():
+        for component in vevent.subcomponents:
             if component.name == "VALARM":
                 if not has_alarm:
                     has_alarm = True
@@ -288,18 +406,14 @@ class ICSAnalyzer:
         
         # Store sample event
         if len(self.report.sample_events) < max_samples:
-            event_data['_has_attendees'] = len(attendees) if attendees else 0
+            event_data['_has_attendees'] = attendee_count
             event_data['_has_reminders'] = has_alarm
             self.report.sample_events.append(event_data)
     
     def _add_field(self, field_name: str, value: Any) -> None:
         """Add a field value to statistics"""
-        field_name = field_name.lower()
-        if field_name not in self.report.fields:
-            self.report.fields[field_name] = FieldStats()
-        
-        str_value = str(value) if value else "(empty)"
-        self.report.fields[field_name].add(str_value)
+        field_name = sys.intern(field_name.lower())
+        self.report.fields[field_name].add(str(value) if value else "(empty)")
     
     def generate_report(self) -> str:
         """Generate a formatted text report"""
@@ -396,12 +510,9 @@ class ICSAnalyzer:
         lines.append("FIELD PRESENCE (what data is available)")
         lines.append("-" * 40)
         
-        # Sort fields by count
-        sorted_fields = sorted(r.fields.items(), key=lambda x: -x[1].count)
-        
-        for field_name, stats in sorted_fields:
-            pct = stats.count / r.total_events * 100
-            bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
+        for field_name, stats, pct in r.sorted_fields:
+            filled = int(pct / 5)
+            bar = "█" * filled + "░" * (20 - filled)
             lines.append(f"  {field_name:30s} {stats.count:>8,} ({pct:5.1f}%) {bar}")
         lines.append("")
         
@@ -537,16 +648,30 @@ class ICSAnalyzer:
             "fields": {
                 name: {
                     "count": stats.count,
-                    "percentage": round(stats.count / r.total_events * 100, 1) if r.total_events > 0 else 0,
+                    "percentage": round(pct, 1),
                     "sample_values": stats.sample_values[:3],
                 }
-                for name, stats in r.fields.items()
+                for name, stats, pct in r.sorted_fields
             },
             "warnings": r.warnings,
             "issues": r.issues,
         }
 
 
+def _analyze_one(ics_path: str, max_samples: int) -> AnalysisReport:
+    """Analyze one file in a worker process and return its report"""
+    analyzer = ICSAnalyzer()
+    analyzer.analyze_file(ics_path, max_samples=max_samples)
+    return analyzer.report
+
+
+def dump_json(obj: Any) -> str:
+    """Serialize a report dict as indented JSON, using orjson when installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, default=str)
+
+
 def find_ics_files(path: str) -> List[str]:
     """Find all ICS files in a path"""
     path = Path(path)
@@ -558,7 +683,8 @@ def find_ics_files(path: str) -> List[str]:
             print(f"Error: {path} is not an ICS file")
             return []
     elif path.is_dir():
-        ics_files = list(path.glob('*.ics')) + list(path.glob('*.ICS'))
+        # One directory read; matches any case of the extension (.ics, .ICS, .Ics)
+        ics_files = [p for p in path.iterdir() if p.suffix.lower() == '.ics' and p.is_file()]
         return [str(f) for f in sorted(ics_files)]
     else:
         print(f"Error: {path} not found")
@@ -600,23 +726,30 @@ Examples:
     # Analyze
     analyzer = ICSAnalyzer()
     
-    for ics_file in ics_files:
-        analyzer.analyze_file(ics_file, max_samples=args.show_samples)
+    if len(ics_files) > 1:
+        # Files are independent, so parse them in parallel and merge
+        workers = min(len(ics_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = executor.map(_analyze_one, ics_files, repeat(args.show_samples))
+            for report in reports:
+                analyzer.report.merge(report, max_samples=args.show_samples)
+    else:
+        analyzer.analyze_file(ics_files[0], max_samples=args.show_samples)
     
     # Generate report
     if args.json:
-        report = json.dumps(analyzer.generate_json_report(), indent=2)
+        report = dump_json(analyzer.generate_json_report())
     else:
         report = analyzer.generate_report()
     
     # Output
     if args.output:
-        with open(args.output, 'w') as f:
+        with open(args.output, 'w', buffering=READ_BUFFER_SIZE) as f:
             f.write(report)
         print(f"\nReport saved to: {args.output}")
     else:
-        print("\n")
-        print(report)
+        # One write for the whole report rather than line-buffered prints
+        sys.stdout.write("\n\n" + report + "\n")
 
 
 if __name__ == '__main__':
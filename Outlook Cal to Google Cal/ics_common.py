@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the calendar scripts.
+
+ics_to_google_calendar.py, ics_analyzer.py, ics_validator.py and
+examine_no_title.py all import from here, so keep it dependency-free.
+"""
+
+from typing import BinaryIO, Iterator, List, Tuple
+
+# Files at least this large are parsed in a process pool. Below this,
+# starting the workers costs more than parsing the file serially.
+PARALLEL_PARSE_MIN_BYTES = 32 * 1024 * 1024
+
+_VCALENDAR_BEGIN = b'BEGIN:VCALENDAR\r\n'
+_VCALENDAR_END = b'END:VCALENDAR\r\n'
+
+
+def strip_mailto(value: str) -> str:
+    """Drop a leading mailto: (any case) from an ATTENDEE/ORGANIZER value"""
+    return value[7:] if value[:7].lower() == 'mailto:' else value
+
+
+def iter_ics_blocks(f: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    """
+    Split an ICS byte stream into top-level component blocks.
+    
+    Yields (name, raw_bytes) pairs, every block parseable on its own with
+    Component.from_ical():
+    
+    - ('VCALENDAR', raw) with the calendar-level properties read so far,
+      as soon as the first nested component starts (so X-WR-TIMEZONE and
+      the like are known before any event), and again at END:VCALENDAR if
+      more properties follow the last component. Each is a complete
+      BEGIN:VCALENDAR/END:VCALENDAR block with no subcomponents.
+    - (name, raw) for each component nested directly inside a VCALENDAR
+      (VTIMEZONE, VEVENT, ...) once its END line is read.
+    
+    Folded continuation lines stay with their block, and stray END lines
+    outside a calendar are ignored. Callers skip the names they don't need.
+    """
+    header: List[bytes] = []
+    block: List[bytes] = []
+    block_name = ''
+    depth = 0
+    
+    for line in f:
+        tag = line[:6].upper()
+        if tag == b'BEGIN:':
+            depth += 1
+            if depth == 2:
+                if header:
+                    yield 'VCALENDAR', _VCALENDAR_BEGIN + b''.join(header) + _VCALENDAR_END
+                    header = []
+                block_name = line[6:].strip().upper().decode('ascii', 'replace')
+                block = []
+            elif depth == 1:
+                continue
+        
+        if depth == 1:
+            if tag[:4] != b'END:':
+                header.append(line)
+        elif depth > 1:
+            block.append(line)
+        
+        if tag[:4] == b'END:':
+            depth -= 1
+            if depth == 1:
+                yield block_name, b''.join(block)
+                block = []
+            elif depth == 0:
+                if header:
+                    yield 'VCALENDAR', _VCALENDAR_BEGIN + b''.join(header) + _VCALENDAR_END
+                    header = []
+            elif depth < 0:
+                depth = 0
@@ -18,6 +18,8 @@ Features:
 
 Requirements:
     pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client icalendar python-dateutil pytz
+    pip install numpy  # optional, faster date-range filtering
+    pip install orjson  # optional, faster request encoding
 
 Setup:
     1. Go to https://console.cloud.google.com/
@@ -52,10 +54,14 @@ import time
 import pickle
 import re
 import hashlib
+import json
 from pathlib import Path
-from datetime import datetime, timedelta, date
-from typing import Optional, List, Dict, Any, Set, Tuple
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone, date
+from typing import Optional, List, Dict, Any, Set, Tuple, Iterable, Iterator
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 # Google API imports
 from google.auth.transport.requests import Request
@@ -63,25 +69,64 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
 # ICS parsing
-from icalendar import Calendar, Event, vRecur
+from icalendar import Component, Event, vRecur
 from dateutil import tz as dateutil_tz
 from dateutil.rrule import rrulestr
 
+from ics_common import PARALLEL_PARSE_MIN_BYTES, iter_ics_blocks, strip_mailto
+
 try:
     import pytz
     HAS_PYTZ = True
 except ImportError:
     HAS_PYTZ = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # OAuth scopes
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Refresh OAuth tokens with less than this many seconds left
+TOKEN_REFRESH_MARGIN = 300
+
 # Rate limiting settings
 REQUESTS_PER_SECOND = 5
 BATCH_SIZE = 50
 
+# Read buffer for streaming ICS files
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Raw VEVENTs are screened on their headers in batches of this size
+PARSE_CHUNK_SIZE = 500
+
+# Header scan of raw VEVENT text (see _scan_vevent_headers)
+_ICS_FOLD_RE = re.compile(rb'\r?\n[ \t]')
+_VEVENT_UID_RE = re.compile(rb'^UID(?:;[^:\r\n]*)?:([^\r\n]*)', re.MULTILINE | re.IGNORECASE)
+_VEVENT_DTSTART_RE = re.compile(rb'^DTSTART(?:;[^:\r\n]*)?:(\d{4})(\d{2})(\d{2})', re.MULTILINE | re.IGNORECASE)
+
+# Default titles for untitled online meetings, by keyword in the
+# description or location (checked in this order)
+MEETING_TITLES = {
+    'zoom': 'Zoom Meeting',
+    'teams': 'Teams Meeting',
+    'webex': 'Webex Meeting',
+    'meet.google': 'Google Meet',
+}
+_MEETING_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in MEETING_TITLES), re.IGNORECASE)
+
 # Common timezone mappings (Windows/Outlook to IANA)
 TIMEZONE_MAPPINGS = {
     'Eastern Standard Time': 'America/New_York',
@@ -122,8 +167,9 @@ TIMEZONE_MAPPINGS = {
 }
 
 
+@lru_cache(maxsize=512)
 def normalize_timezone(tz_str: str) -> str:
-    """Convert Windows/Outlook timezone names to IANA timezone names"""
+    """Convert Windows/Outlook timezone names to IANA timezone names (cached per name)"""
     if not tz_str:
         return 'UTC'
     
@@ -148,13 +194,13 @@ def normalize_timezone(tz_str: str) -> str:
     return 'UTC'
 
 
-def filter_events_by_date(events: List[Dict[str, Any]], 
+def filter_events_by_date(events: Iterable[Dict[str, Any]], 
                           start_date: Optional[date] = None, 
                           end_date: Optional[date] = None) -> List[Dict[str, Any]]:
     """Filter events by date range based on their start time.
     
     Args:
-        events: List of Google Calendar event dictionaries
+        events: Google Calendar event dictionaries (a list or any iterable)
         start_date: Only include events starting on or after this date
         end_date: Only include events starting before this date
     
@@ -164,6 +210,12 @@ def filter_events_by_date(events: List[Dict[str, Any]],
     if not start_date and not end_date:
         return events
     
+    if HAS_NUMPY:
+        events = list(events)
+        filtered = _filter_events_by_date_numpy(events, start_date, end_date)
+        if filtered is not None:
+            return filtered
+    
     filtered = []
     for event in events:
         start = event.get('start', {})
@@ -174,13 +226,9 @@ def filter_events_by_date(events: List[Dict[str, Any]],
             continue
         
         try:
-            # Parse the start date
-            if 'T' in start_str:
-                # DateTime format: 2024-01-15T10:00:00-06:00
-                event_date = datetime.fromisoformat(start_str.replace('Z', '+00:00')).date()
-            else:
-                # Date format: 2024-01-15
-                event_date = datetime.strptime(start_str, '%Y-%m-%d').date()
+            # Date (2024-01-15) and dateTime (2024-01-15T10:00:00-06:00)
+            # both start with the date, so slice it out directly
+            event_date = date(int(start_str[0:4]), int(start_str[5:7]), int(start_str[8:10]))
             
             # Apply filters
             if start_date and event_date < start_date:
@@ -197,6 +245,176 @@ def filter_events_by_date(events: List[Dict[str, Any]],
     return filtered
 
 
+def _filter_events_by_date_numpy(events: List[Dict[str, Any]],
+                                 start_date: Optional[date],
+                                 end_date: Optional[date]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Vectorized filter_events_by_date(): one numpy conversion and comparison
+    for the whole list instead of a date parse per event.
+    
+    Returns None if any start isn't a plain ISO date, so the caller can fall
+    back to the per-event loop and its handling of unparseable dates.
+    """
+    starts = []
+    for event in events:
+        start = event.get('start', {})
+        start_str = start.get('dateTime') or start.get('date') or ''
+        # numpy also accepts partial dates ('2024', '2024-01') that strptime rejects
+        if start_str and (start_str[4:5] != '-' or start_str[7:8] != '-' or len(start_str) < 10):
+            return None
+        starts.append(start_str[:10])
+    
+    try:
+        dates = np.array(starts, dtype='datetime64[D]')
+    except ValueError:
+        return None
+    
+    # Missing starts are NaT and get dropped, as in the loop
+    keep = ~np.isnat(dates)
+    if start_date:
+        keep &= dates >= np.datetime64(start_date, 'D')
+    if end_date:
+        keep &= dates < np.datetime64(end_date, 'D')
+    
+    return [events[i] for i in np.flatnonzero(keep)]
+
+
+def _scan_vevent_headers(raw: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read UID and the DTSTART date from a raw VEVENT without parsing it.
+    
+    Returns (uid, 'YYYY-MM-DD'); either is None when it can't be read
+    reliably this way, and the full parse has to decide instead.
+    """
+    # Only the event's own properties, not those of nested VALARMs
+    nested = raw.find(b'\nBEGIN:')
+    if nested != -1:
+        raw = raw[:nested]
+    raw = _ICS_FOLD_RE.sub(b'', raw)
+    
+    uid = None
+    match = _VEVENT_UID_RE.search(raw)
+    # Escaped text would need unescaping to match icalendar's value
+    if match and b'\\' not in match.group(1):
+        try:
+            uid = match.group(1).decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+    
+    start = None
+    match = _VEVENT_DTSTART_RE.search(raw)
+    if match:
+        start = b'-'.join(match.groups()).decode('ascii')
+    
+    return uid, start
+
+
+def _retry_after_seconds(error: HttpError, default: int = 60) -> int:
+    """Seconds to wait after a 429, from its Retry-After header if present"""
+    try:
+        return max(1, int(error.resp.get('retry-after', default)))
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+def _format_recurrence_dates(name: str, values) -> List[str]:
+    """
+    Format EXDATE/RDATE properties as recurrence lines: one comma-separated
+    line for all date values and one for all date-time values.
+    """
+    if type(values) is not list:
+        values = [values]
+    
+    dates = []
+    date_times = []
+    for value in values:
+        for dt in getattr(value, 'dts', None) or ():
+            d = dt.dt
+            if type(d) is date:
+                dates.append(f'{d.year:04d}{d.month:02d}{d.day:02d}')
+            else:
+                date_times.append(f'{d.year:04d}{d.month:02d}{d.day:02d}T{d.hour:02d}{d.minute:02d}{d.second:02d}Z')
+    
+    lines = []
+    if dates:
+        lines.append(f'{name};VALUE=DATE:{",".join(dates)}')
+    if date_times:
+        lines.append(f'{name}:{",".join(date_times)}')
+    return lines
+
+
+class UIDSet:
+    """
+    Set of event UIDs, stored as 16-byte BLAKE2b digests.
+    
+    Outlook UIDs are 100+ character strings, so for large calendars this
+    takes a fraction of the memory of a set of the UIDs themselves, and at
+    this digest size a false match is practically impossible.
+    """
+    
+    def __init__(self, uids: Iterable[str] = ()):
+        self._digests: Set[bytes] = set()
+        for uid in uids:
+            self.add(uid)
+    
+    @staticmethod
+    def _digest(uid: str) -> bytes:
+        return hashlib.blake2b(uid.encode('utf-8'), digest_size=16).digest()
+    
+    def add(self, uid: str) -> None:
+        self._digests.add(self._digest(uid))
+    
+    def __contains__(self, uid) -> bool:
+        return bool(uid) and self._digest(uid) in self._digests
+    
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that serializes request bodies with orjson.
+    
+    Bodies containing non-ASCII text fall back to json.dumps(): batch
+    requests size each part with len() of the serialized string, which
+    only matches the byte length for ASCII.
+    """
+    
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        data = orjson.dumps(body_value)
+        if data.isascii():
+            return data.decode('ascii')
+        return json.dumps(body_value)
+
+
+class RateLimiter:
+    """
+    Token bucket: REQUESTS_PER_SECOND-style average rate, with bursts of up
+    to `burst` requests (one import batch) after the bucket has refilled.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+    
+    def wait(self, requests: int = 1) -> None:
+        """Block until `requests` more requests may be sent, and take them"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        
+        if self._tokens < requests:
+            time.sleep((requests - self._tokens) / self.rate)
+            self._tokens = float(requests)
+            self._last = time.monotonic()
+        
+        self._tokens -= requests
+
+
 class GoogleCalendarImporter:
     def __init__(self, credentials_file: str = 'credentials.json', token_file: str = 'token.pickle'):
         self.credentials_file = credentials_file
@@ -204,6 +422,7 @@ class GoogleCalendarImporter:
         self.service = None
         self.default_timezone = 'UTC'
         self.dry_run = False  # Track if we're in dry-run mode
+        self.rate_limiter = RateLimiter(REQUESTS_PER_SECOND, burst=BATCH_SIZE)
         self.stats = {
             'total_events': 0,
             'imported': 0,
@@ -221,9 +440,16 @@ class GoogleCalendarImporter:
             with open(self.token_file, 'rb') as token:
                 creds = pickle.load(token)
         
+        # Refresh tokens that are expired or about to expire; a token with
+        # time left is used as-is, without a refresh round trip
+        expiring = False
+        if creds and creds.valid and creds.expiry:
+            remaining = creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)
+            expiring = remaining.total_seconds() < TOKEN_REFRESH_MARGIN
+        
         # If no valid credentials, initiate OAuth flow
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+        if not creds or not creds.valid or expiring:
+            if creds and (creds.expired or expiring) and creds.refresh_token:
                 print("Refreshing expired credentials...")
                 creds.refresh(Request())
             else:
@@ -251,20 +477,18 @@ class GoogleCalendarImporter:
                 )
                 creds = flow.run_local_server(port=0)
             
-            # Save credentials for future runs
+            # Save credentials for future runs (only reached when they changed)
             with open(self.token_file, 'wb') as token:
                 pickle.dump(creds, token)
             print("Authentication successful! Credentials saved.\n")
-            sys.stdout.flush()
         
         # Build the Calendar API service
-        print("Building Google Calendar API service...")
-        sys.stdout.flush()
-        self.service = build('calendar', 'v3', credentials=creds)
+        print("Building Google Calendar API service...", flush=True)
+        self.service = build('calendar', 'v3', credentials=creds,
+                             model=OrjsonModel() if HAS_ORJSON else None)
         
         # Get default timezone from primary calendar
-        print("Getting calendar timezone...")
-        sys.stdout.flush()
+        print("Getting calendar timezone...", flush=True)
         try:
             calendar = self.service.calendars().get(calendarId='primary').execute()
             self.default_timezone = calendar.get('timeZone', 'UTC')
@@ -290,102 +514,218 @@ class GoogleCalendarImporter:
         
         return calendars
     
-    def parse_ics_file(self, ics_path: str, include_attendees: bool = True) -> Tuple[List[Dict[str, Any]], str]:
-        """Parse an ICS file and extract events. Returns (events, calendar_timezone)"""
-        events = []
-        calendar_tz = self.default_timezone
+    def parse_ics_file(self, ics_path: str, include_attendees: bool = True,
+                       start_date: Optional[date] = None, end_date: Optional[date] = None,
+                       skip_uids: Optional[UIDSet] = None) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Stream events from an ICS file as (event, calendar_timezone) tuples.
         
+        The file is read line by line and each VEVENT is parsed and converted
+        on its own, so memory use stays at roughly one event however large
+        the export is, and importing can start before the file is fully read.
+        
+        Events starting outside [start_date, end_date) or whose UID is in
+        skip_uids are dropped from a scan of the raw text, before the much
+        more expensive full parse. Large files are parsed and converted in a
+        process pool, a few chunks ahead of the events being consumed.
+        """
         print(f"\nParsing: {ics_path}")
         file_size = os.path.getsize(ics_path)
-        print(f"File size: {file_size / 1024 / 1024:.2f} MB")
-        print("Reading file (this may take a moment for large files)...")
-        sys.stdout.flush()
+        print(f"File size: {file_size / 1024 / 1024:.2f} MB", flush=True)
         
-        with open(ics_path, 'rb') as f:
-            try:
-                raw_data = f.read()
-                print(f"Read {len(raw_data) / 1024 / 1024:.2f} MB, parsing ICS format...")
-                sys.stdout.flush()
-                cal = Calendar.from_ical(raw_data)
-                print("ICS parsed successfully")
-                sys.stdout.flush()
-            except Exception as e:
-                print(f"Error parsing ICS file: {e}")
-                return events, calendar_tz
-        
-        # Extract calendar-level timezone
-        for component in cal.walk():
-            if component.name == "VCALENDAR":
-                x_wr_timezone = component.get('x-wr-timezone')
-                if x_wr_timezone:
-                    calendar_tz = normalize_timezone(str(x_wr_timezone))
-                    break
-            elif component.name == "VTIMEZONE":
-                tzid = component.get('tzid')
-                if tzid:
-                    calendar_tz = normalize_timezone(str(tzid))
-                    break
+        executor = None
+        max_in_flight = 0
+        workers = os.cpu_count() or 1
+        if file_size >= PARALLEL_PARSE_MIN_BYTES and workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            max_in_flight = workers * 2
+            print(f"Converting with {workers} worker processes")
+        
+        counts = {'converted': 0, 'out_of_range': 0, 'duplicates': 0}
+        in_flight = deque()
+        try:
+            for calendar_tz, tz_blocks, blocks in self._read_vevent_chunks(ics_path):
+                stubs = self._screen_vevent_blocks(blocks, start_date, end_date, skip_uids, counts)
+                
+                if executor is None:
+                    results = (self._convert_raw_vevent(stub['raw'], calendar_tz, include_attendees) for stub in stubs)
+                    yield from self._yield_converted(stubs, results, calendar_tz, start_date, end_date, counts)
+                    continue
+                
+                future = executor.submit(_convert_vevent_chunk, [stub['raw'] for stub in stubs],
+                                         tuple(tz_blocks), calendar_tz, include_attendees)
+                in_flight.append((stubs, calendar_tz, future))
+                while len(in_flight) > max_in_flight:
+                    yield from self._yield_from_future(*in_flight.popleft(), start_date, end_date, counts)
+            
+            while in_flight:
+                yield from self._yield_from_future(*in_flight.popleft(), start_date, end_date, counts)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
-        print(f"Calendar timezone: {calendar_tz}")
-        print("Converting events to Google Calendar format...")
-        sys.stdout.flush()
+        print(f"Found {counts['converted']} events in file")
+        if start_date or end_date:
+            print(f"Date filter: {counts['out_of_range']} events outside range skipped")
+        if counts['duplicates']:
+            print(f"Already in calendar: {counts['duplicates']} events skipped")
+    
+    def _read_vevent_chunks(self, ics_path: str) -> Iterator[Tuple[str, List[bytes], List[bytes]]]:
+        """
+        Read an ICS file as (calendar_timezone, vtimezone_blocks, vevent_blocks),
+        with up to PARSE_CHUNK_SIZE raw VEVENTs per chunk.
+        """
+        calendar_tz = self.default_timezone
+        tz_found = False
+        tz_reported = False
+        tz_blocks = []
+        pending = []
         
-        # Parse events
-        event_count = 0
-        for component in cal.walk():
-            if component.name == "VEVENT":
-                try:
-                    event = self._convert_vevent_to_google_event(component, calendar_tz, include_attendees)
-                    if event:
-                        events.append(event)
-                        event_count += 1
-                        if event_count % 1000 == 0:
-                            print(f"  Converted {event_count} events...")
-                            sys.stdout.flush()
-                except Exception as e:
-                    print(f"Warning: Could not parse event: {e}")
-                    self.stats['errors'] += 1
-        
-        print(f"Found {len(events)} events in file")
-        sys.stdout.flush()
-        return events, calendar_tz
+        with open(ics_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            for name, raw in iter_ics_blocks(f):
+                if name == "VEVENT":
+                    if not tz_reported:
+                        print(f"Calendar timezone: {calendar_tz}")
+                        print("Converting events to Google Calendar format...")
+                        tz_reported = True
+                    
+                    pending.append(raw)
+                    if len(pending) >= PARSE_CHUNK_SIZE:
+                        yield calendar_tz, tz_blocks, pending
+                        pending = []
+                
+                elif name in ("VCALENDAR", "VTIMEZONE"):
+                    # VTIMEZONEs are always parsed so their TZIDs are
+                    # registered before the events that reference them
+                    try:
+                        component = Component.from_ical(raw)
+                    except Exception as e:
+                        print(f"Warning: Could not parse {name}: {e}")
+                        continue
+                    
+                    if name == "VTIMEZONE":
+                        # Pool workers register these themselves
+                        tz_blocks.append(raw)
+                    
+                    # Calendar-level timezone: X-WR-TIMEZONE, else the first VTIMEZONE
+                    if not tz_found:
+                        tz_value = component.get('x-wr-timezone' if name == "VCALENDAR" else 'tzid')
+                        if tz_value:
+                            # Events read so far keep the timezone they were read under
+                            if pending:
+                                yield calendar_tz, tz_blocks, pending
+                                pending = []
+                            calendar_tz = normalize_timezone(str(tz_value))
+                            tz_found = True
+        
+        if pending:
+            yield calendar_tz, tz_blocks, pending
+    
+    def _screen_vevent_blocks(self, blocks: List[bytes], start_date: Optional[date], end_date: Optional[date],
+                              skip_uids: Optional[UIDSet], counts: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Screen a batch of raw VEVENTs on UID/DTSTART, returning stubs for the ones to parse"""
+        # A start date the scan can't read is passed through as '?' (the
+        # date filter keeps unparseable dates) and rechecked once the event
+        # has been converted
+        stubs = [{'iCalUID': uid, 'start': {'date': start or '?'}, 'raw': raw, 'recheck': start is None}
+                 for raw, (uid, start) in zip(blocks, map(_scan_vevent_headers, blocks))]
+        
+        if start_date or end_date:
+            in_range = filter_events_by_date(stubs, start_date, end_date)
+            counts['out_of_range'] += len(stubs) - len(in_range)
+            stubs = in_range
+        
+        if not skip_uids:
+            return stubs
+        
+        new_stubs = [stub for stub in stubs if stub['iCalUID'] not in skip_uids]
+        duplicates = len(stubs) - len(new_stubs)
+        counts['duplicates'] += duplicates
+        self.stats['total_events'] += duplicates
+        self.stats['skipped'] += duplicates
+        return new_stubs
+    
+    def _convert_raw_vevent(self, raw: bytes, calendar_tz: str,
+                            include_attendees: bool) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Parse and convert one raw VEVENT, returning (event, error message)"""
+        try:
+            vevent = Component.from_ical(raw)
+            return self._convert_vevent_to_google_event(vevent, calendar_tz, include_attendees), None
+        except Exception as e:
+            return None, str(e)
+    
+    def _yield_from_future(self, stubs: List[Dict[str, Any]], calendar_tz: str, future,
+                           start_date: Optional[date], end_date: Optional[date],
+                           counts: Dict[str, int]) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Wait for a pool worker's chunk and yield its events"""
+        results, attendees_imported = future.result()
+        self.stats['attendees_imported'] += attendees_imported
+        yield from self._yield_converted(stubs, results, calendar_tz, start_date, end_date, counts)
+    
+    def _yield_converted(self, stubs: List[Dict[str, Any]], results: Iterable[Tuple[Optional[Dict[str, Any]], Optional[str]]],
+                         calendar_tz: str, start_date: Optional[date], end_date: Optional[date],
+                         counts: Dict[str, int]) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Report parse errors and yield converted events, in file order"""
+        for stub, (event, error) in zip(stubs, results):
+            if error is not None:
+                print(f"Warning: Could not parse event: {error}")
+                self.stats['errors'] += 1
+                continue
+            
+            if not event:
+                continue
+            
+            if stub['recheck'] and (start_date or end_date):
+                if not filter_events_by_date([event], start_date, end_date):
+                    counts['out_of_range'] += 1
+                    continue
+            
+            counts['converted'] += 1
+            if counts['converted'] % 1000 == 0:
+                print(f"  Converted {counts['converted']} events...")
+            yield event, calendar_tz
     
     def _convert_vevent_to_google_event(self, vevent, calendar_tz: str, include_attendees: bool = True) -> Optional[Dict[str, Any]]:
         """Convert an iCalendar VEVENT to Google Calendar event format"""
         event = {}
         
+        # Read all properties in one pass instead of a lookup per field
+        props = {key.lower(): value for key, value in vevent.items()}
+        
         # UID - required for import API
-        uid = vevent.get('uid')
+        uid = props.get('uid')
         if uid:
             # Google requires iCalUID for import
             event['iCalUID'] = str(uid)
         else:
-            # Generate a UID if none exists
+            # Generate a UID if none exists. Keep this exact input and hash:
+            # re-imports skip duplicates by iCalUID, so any change would
+            # duplicate UID-less events imported by earlier versions
             event['iCalUID'] = hashlib.md5(str(vevent.to_ical()).encode()).hexdigest() + "@imported"
         
         # Summary (title)
-        summary = vevent.get('summary')
+        summary = props.get('summary')
         if summary and str(summary).strip():
             event['summary'] = str(summary)
         else:
             # Smart default title based on event content
-            description = vevent.get('description')
-            location = vevent.get('location')
-            desc_str = str(description).lower() if description else ''
-            loc_str = str(location).lower() if location else ''
+            description = props.get('description')
+            location = props.get('location')
+            desc_str = str(description) if description else ''
+            loc_str = str(location) if location else ''
             
-            if 'zoom' in desc_str or 'zoom' in loc_str:
-                event['summary'] = 'Zoom Meeting'
-            elif 'teams' in desc_str or 'teams' in loc_str or 'microsoft teams' in desc_str:
-                event['summary'] = 'Teams Meeting'
-            elif 'webex' in desc_str or 'webex' in loc_str:
-                event['summary'] = 'Webex Meeting'
-            elif 'meet.google' in desc_str or 'meet.google' in loc_str:
-                event['summary'] = 'Google Meet'
+            # One case-insensitive scan per field for all keywords (no
+            # lowercased or joined copies); MEETING_TITLES order decides ties
+            found = {match.lower() for text in (desc_str, loc_str) if text
+                     for match in _MEETING_KEYWORD_RE.findall(text)}
+            meeting_title = next((title for keyword, title in MEETING_TITLES.items() if keyword in found), None)
+            
+            if meeting_title:
+                event['summary'] = meeting_title
             else:
                 # Check busy status
-                busystatus = vevent.get('x-microsoft-cdo-busystatus')
-                transp = vevent.get('transp')
+                busystatus = props.get('x-microsoft-cdo-busystatus')
+                transp = props.get('transp')
                 
                 if busystatus:
                     status_str = str(busystatus).upper()
@@ -403,17 +743,17 @@ class GoogleCalendarImporter:
                     event['summary'] = 'Busy'
         
         # Description
-        description = vevent.get('description')
+        description = props.get('description')
         if description:
             event['description'] = str(description)
         
         # Location
-        location = vevent.get('location')
+        location = props.get('location')
         if location:
             event['location'] = str(location)
         
         # Start time
-        dtstart = vevent.get('dtstart')
+        dtstart = props.get('dtstart')
         if not dtstart:
             return None
         
@@ -421,26 +761,26 @@ class GoogleCalendarImporter:
         start_tz = self._get_timezone(dtstart, calendar_tz)
         
         # End time
-        dtend = vevent.get('dtend')
+        dtend = props.get('dtend')
         if dtend:
             end_dt = dtend.dt
             end_tz = self._get_timezone(dtend, calendar_tz)
         else:
             # If no end time, check for duration or assume 1 hour/1 day
-            duration = vevent.get('duration')
+            duration = props.get('duration')
             if duration:
                 end_dt = start_dt + duration.dt
-            elif isinstance(start_dt, date) and not isinstance(start_dt, datetime):
+            elif type(start_dt) is date:
                 end_dt = start_dt + timedelta(days=1)
             else:
                 end_dt = start_dt + timedelta(hours=1)
             end_tz = start_tz
         
         # Check if all-day event (date vs datetime)
-        if isinstance(start_dt, date) and not isinstance(start_dt, datetime):
+        if type(start_dt) is date:
             # All-day event
             event['start'] = {'date': start_dt.isoformat()}
-            if isinstance(end_dt, date) and not isinstance(end_dt, datetime):
+            if type(end_dt) is date:
                 event['end'] = {'date': end_dt.isoformat()}
             else:
                 event['end'] = {'date': end_dt.date().isoformat()}
@@ -456,42 +796,26 @@ class GoogleCalendarImporter:
             }
         
         # Recurrence rules
-        rrule = vevent.get('rrule')
+        rrule = props.get('rrule')
         if rrule:
             recurrence = []
             rrule_str = rrule.to_ical().decode('utf-8')
             recurrence.append(f'RRULE:{rrule_str}')
             
             # Handle EXDATE (exceptions to recurrence)
-            exdates = vevent.get('exdate')
+            exdates = props.get('exdate')
             if exdates:
-                if not isinstance(exdates, list):
-                    exdates = [exdates]
-                for exdate in exdates:
-                    if hasattr(exdate, 'dts'):
-                        for dt in exdate.dts:
-                            if isinstance(dt.dt, date) and not isinstance(dt.dt, datetime):
-                                recurrence.append(f'EXDATE;VALUE=DATE:{dt.dt.strftime("%Y%m%d")}')
-                            else:
-                                recurrence.append(f'EXDATE:{dt.dt.strftime("%Y%m%dT%H%M%SZ")}')
+                recurrence.extend(_format_recurrence_dates('EXDATE', exdates))
             
             # Handle RDATE (additional dates)
-            rdates = vevent.get('rdate')
+            rdates = props.get('rdate')
             if rdates:
-                if not isinstance(rdates, list):
-                    rdates = [rdates]
-                for rdate in rdates:
-                    if hasattr(rdate, 'dts'):
-                        for dt in rdate.dts:
-                            if isinstance(dt.dt, date) and not isinstance(dt.dt, datetime):
-                                recurrence.append(f'RDATE;VALUE=DATE:{dt.dt.strftime("%Y%m%d")}')
-                            else:
-                                recurrence.append(f'RDATE:{dt.dt.strftime("%Y%m%dT%H%M%SZ")}')
+                recurrence.extend(_format_recurrence_dates('RDATE', rdates))
             
             event['recurrence'] = recurrence
         
         # Status
-        status = vevent.get('status')
+        status = props.get('status')
         if status:
             status_str = str(status).upper()
             if status_str == 'CANCELLED':
@@ -502,12 +826,12 @@ class GoogleCalendarImporter:
                 event['status'] = 'confirmed'
         
         # Transparency (busy/free)
-        transp = vevent.get('transp')
+        transp = props.get('transp')
         if transp:
             event['transparency'] = 'transparent' if str(transp).upper() == 'TRANSPARENT' else 'opaque'
         
         # Visibility/Class
-        classification = vevent.get('class')
+        classification = props.get('class')
         if classification:
             class_str = str(classification).upper()
             if class_str == 'PRIVATE':
@@ -518,27 +842,28 @@ class GoogleCalendarImporter:
                 event['visibility'] = 'default'
         
         # Organizer
-        organizer = vevent.get('organizer')
+        organizer = props.get('organizer')
         if organizer:
-            org_email = str(organizer).replace('mailto:', '').replace('MAILTO:', '')
+            org_email = strip_mailto(str(organizer))
             # Skip invalid organizer emails
             if org_email and '@' in org_email and not org_email.startswith('invalid:'):
-                org_name = organizer.params.get('CN', '') if hasattr(organizer, 'params') else ''
+                org_params = getattr(organizer, 'params', None)
+                org_name = org_params.get('CN', '') if org_params is not None else ''
                 event['organizer'] = {'email': org_email}
                 if org_name:
                     event['organizer']['displayName'] = org_name
         
         # Attendees
         if include_attendees:
-            attendees = vevent.get('attendee')
+            attendees = props.get('attendee')
             if attendees:
-                if not isinstance(attendees, list):
+                if type(attendees) is not list:
                     attendees = [attendees]
                 
                 event_attendees = []
                 for attendee in attendees:
                     try:
-                        email = str(attendee).replace('mailto:', '').replace('MAILTO:', '')
+                        email = strip_mailto(str(attendee))
                         
                         # Skip invalid email addresses
                         if not email or '@' not in email:
@@ -552,9 +877,8 @@ class GoogleCalendarImporter:
                         att_data = {'email': email}
                         
                         # Get attendee parameters
-                        if hasattr(attendee, 'params'):
-                            params = attendee.params
-                            
+                        params = getattr(attendee, 'params', None)
+                        if params is not None:
                             # Display name
                             cn = params.get('CN')
                             if cn:
@@ -593,16 +917,19 @@ class GoogleCalendarImporter:
         
         # Reminders/Alarms
         reminders = []
-        for component in vevent.walk():
+        # VALARMs are direct children; most events have none, so this is
+        # usually an empty list rather than a walk() over the whole tree
+        for component in vevent.subcomponents:
             if component.name == "VALARM":
                 try:
                     action = component.get('action')
                     trigger = component.get('trigger')
                     
-                    if trigger and hasattr(trigger, 'dt'):
+                    trigger_dt = getattr(trigger, 'dt', None) if trigger else None
+                    if trigger_dt is not None:
                         # Convert trigger to minutes before event
-                        if isinstance(trigger.dt, timedelta):
-                            minutes = abs(int(trigger.dt.total_seconds() / 60))
+                        if type(trigger_dt) is timedelta:
+                            minutes = abs(int(trigger_dt.total_seconds() / 60))
                             
                             # Google Calendar max is 40320 minutes (4 weeks)
                             if minutes > 40320:
@@ -635,7 +962,7 @@ class GoogleCalendarImporter:
             }
         
         # Sequence number
-        sequence = vevent.get('sequence')
+        sequence = props.get('sequence')
         if sequence:
             event['sequence'] = int(sequence)
         
@@ -651,28 +978,35 @@ class GoogleCalendarImporter:
     
     def _get_timezone(self, dt_prop, default_tz: str) -> str:
         """Extract and normalize timezone from a datetime property"""
-        if hasattr(dt_prop, 'params'):
-            tzid = dt_prop.params.get('TZID')
+        params = getattr(dt_prop, 'params', None)
+        if params is not None:
+            tzid = params.get('TZID')
             if tzid:
                 return normalize_timezone(str(tzid))
         
         # Check if datetime has tzinfo
-        if hasattr(dt_prop, 'dt') and hasattr(dt_prop.dt, 'tzinfo') and dt_prop.dt.tzinfo:
-            tz_name = str(dt_prop.dt.tzinfo)
+        tzinfo = getattr(getattr(dt_prop, 'dt', None), 'tzinfo', None)
+        if tzinfo:
+            tz_name = str(tzinfo)
             if tz_name and tz_name != 'UTC':
                 return normalize_timezone(tz_name)
         
         return default_tz
     
-    def import_events(self, events: List[Dict[str, Any]], calendar_id: str = 'primary', 
-                      skip_duplicates: bool = True, dry_run: bool = False) -> None:
-        """Import events to Google Calendar using the import API (no notifications sent)"""
+    def import_events(self, events: Iterable[Dict[str, Any]], calendar_id: str = 'primary', 
+                      skip_duplicates: bool = True, dry_run: bool = False,
+                      existing_uids: Optional[UIDSet] = None) -> None:
+        """
+        Import events to Google Calendar using the import API (no notifications sent).
+        
+        Events may come from a list or a lazy iterator such as parse_ics_file().
+        existing_uids, if given, is used (and updated) instead of fetching
+        the calendar's UIDs again.
+        """
         self.dry_run = dry_run  # Track for summary
-        total = len(events)
-        self.stats['total_events'] += total
         
         mode_str = "DRY RUN - " if dry_run else ""
-        print(f"\n{mode_str}Importing {total} events to Google Calendar...")
+        print(f"\n{mode_str}Importing events to Google Calendar...")
         print(f"Calendar ID: {calendar_id}")
         if dry_run:
             print("MODE: Dry run - no events will be created")
@@ -681,27 +1015,36 @@ class GoogleCalendarImporter:
         print("-" * 60)
         
         # Get existing event UIDs if checking for duplicates
-        existing_uids = set()
-        if skip_duplicates and not dry_run:
-            print("Checking for existing events...")
-            existing_uids = self._get_existing_uids(calendar_id)
-            print(f"Found {len(existing_uids)} existing events")
-        
-        imported = 0
-        skipped = 0
-        errors = 0
+        if existing_uids is None:
+            existing_uids = UIDSet()
+            if skip_duplicates and not dry_run:
+                print("Checking for existing events...")
+                existing_uids = self._get_existing_uids(calendar_id)
+                print(f"Found {len(existing_uids)} existing events")
+        
+        counts = {'imported': 0, 'skipped': 0, 'errors': 0}
         last_progress_time = time.time()
+        last_progress_count = 0
+        
+        # Events are sent BATCH_SIZE at a time in one HTTP batch request;
+        # the batch is halved each time the API rate limits it, and grows
+        # back after batches that go through
+        batch: List[Dict[str, Any]] = []
+        batch_uids: Set[str] = set()
+        batch_size = BATCH_SIZE
         
+        i = -1
         for i, event in enumerate(events):
             # Check for duplicate by iCalUID
             ical_uid = event.get('iCalUID', '')
-            if skip_duplicates and ical_uid in existing_uids:
-                skipped += 1
+            if skip_duplicates and (ical_uid in existing_uids or ical_uid in batch_uids):
+                counts['skipped'] += 1
                 continue
             
             if dry_run:
                 # In dry-run mode, just count and optionally show details
-                imported += 1
+                counts['imported'] += 1
+                imported = counts['imported']
                 if imported <= 10:
                     # Show first 10 events
                     summary = event.get('summary', '(no title)')
@@ -711,87 +1054,41 @@ class GoogleCalendarImporter:
                     att_str = f" ({attendee_count} attendees)" if attendee_count else ""
                     print(f"  Would import: {summary[:60]}{att_str}")
                     print(f"               Start: {start_str}")
-                    sys.stdout.flush()
                 elif imported == 11:
                     print(f"  ... and more events")
-                    sys.stdout.flush()
                 continue
             
-            # Rate limiting
-            if imported > 0 and imported % REQUESTS_PER_SECOND == 0:
-                time.sleep(1)
-            
-            try:
-                # Use import_ instead of insert - this doesn't send notifications
-                self.service.events().import_(
-                    calendarId=calendar_id,
-                    body=event
-                ).execute()
-                imported += 1
-                
-                # Add to existing UIDs to prevent duplicates within same run
-                if ical_uid:
-                    existing_uids.add(ical_uid)
-                
-            except HttpError as e:
-                if e.resp.status == 429:  # Rate limit exceeded
-                    print("\nRate limit hit, waiting 60 seconds...")
-                    time.sleep(60)
-                    # Retry
-                    try:
-                        self.service.events().import_(
-                            calendarId=calendar_id,
-                            body=event
-                        ).execute()
-                        imported += 1
-                        if ical_uid:
-                            existing_uids.add(ical_uid)
-                    except Exception as retry_error:
-                        errors += 1
-                        if errors <= 10:
-                            print(f"Retry failed for '{event.get('summary', 'Unknown')}': {retry_error}")
-                elif e.resp.status == 409:  # Conflict - event already exists
-                    skipped += 1
-                elif e.resp.status == 400 and 'participantIsNeitherOrganizerNorAttendee' in str(e):
-                    # User is not organizer or attendee - retry without attendees/organizer
-                    event_copy = event.copy()
-                    event_copy.pop('organizer', None)
-                    event_copy.pop('attendees', None)
-                    try:
-                        self.service.events().import_(
-                            calendarId=calendar_id,
-                            body=event_copy
-                        ).execute()
-                        imported += 1
-                        self.stats['imported_without_attendees'] = self.stats.get('imported_without_attendees', 0) + 1
-                        if ical_uid:
-                            existing_uids.add(ical_uid)
-                    except Exception as retry_error:
-                        errors += 1
-                        if errors <= 10:
-                            print(f"Fallback failed for '{event.get('summary', 'Unknown')}': {retry_error}")
-                else:
-                    errors += 1
-                    if errors <= 10:
-                        print(f"Error importing '{event.get('summary', 'Unknown')}': {e}")
-                    elif errors == 11:
-                        print("(Suppressing further error messages...)")
+            batch.append(event)
+            if ical_uid:
+                batch_uids.add(ical_uid)
+            if len(batch) < batch_size:
+                continue
             
-            except Exception as e:
-                errors += 1
-                if errors <= 10:
-                    print(f"Error importing '{event.get('summary', 'Unknown')}': {e}")
+            # Rate limiting - each event in the batch counts as a request
+            self.rate_limiter.wait(len(batch))
+            if self._import_batch(batch, calendar_id, existing_uids, counts):
+                batch_size = max(1, batch_size // 2)
+            else:
+                batch_size = min(BATCH_SIZE, batch_size * 2)
+            batch = []
+            batch_uids = set()
             
-            # Progress update every 100 events or every 10 seconds (skip for dry-run, shown at end)
-            if not dry_run:
-                current_time = time.time()
-                if (i + 1) % 100 == 0 or (i + 1) == total or (current_time - last_progress_time) > 10:
-                    elapsed = current_time - last_progress_time
-                    rate = 100 / elapsed if elapsed > 0 and (i + 1) % 100 == 0 else 0
-                    print(f"Progress: {i + 1}/{total} ({imported} imported, {skipped} skipped, {errors} errors)" + 
-                          (f" [{rate:.1f} events/sec]" if rate > 0 else ""))
-                    last_progress_time = current_time
+            # Progress update every 100 events or every 10 seconds
+            current_time = time.time()
+            if (i + 1) // 100 > last_progress_count // 100 or (current_time - last_progress_time) > 10:
+                elapsed = current_time - last_progress_time
+                rate = (i + 1 - last_progress_count) / elapsed if elapsed > 0 else 0
+                print(f"Progress: {i + 1} processed ({counts['imported']} imported, {counts['skipped']} skipped, {counts['errors']} errors)" + 
+                      (f" [{rate:.1f} events/sec]" if rate > 0 else ""))
+                last_progress_time = current_time
+                last_progress_count = i + 1
         
+        if batch:
+            self.rate_limiter.wait(len(batch))
+            self._import_batch(batch, calendar_id, existing_uids, counts)
+        
+        imported, skipped, errors = counts['imported'], counts['skipped'], counts['errors']
+        self.stats['total_events'] += i + 1
         self.stats['imported'] += imported
         self.stats['skipped'] += skipped
         self.stats['errors'] += errors
@@ -802,9 +1099,98 @@ class GoogleCalendarImporter:
         else:
             print(f"File complete: {imported} imported, {skipped} skipped, {errors} errors")
     
-    def _get_existing_uids(self, calendar_id: str) -> Set[str]:
+    def _import_batch(self, events: List[Dict[str, Any]], calendar_id: str,
+                      existing_uids: UIDSet, counts: Dict[str, int], retry: bool = False) -> bool:
+        """
+        Import events with a single HTTP batch request.
+        
+        Events that hit the rate limit are retried once, in a new batch after
+        waiting as long as the API's Retry-After asks (60 seconds if it
+        doesn't say). Returns True if the rate limit was hit.
+        """
+        responses = {}
+        
+        def on_response(request_id, response, exception):
+            responses[request_id] = exception
+        
+        batch = self.service.new_batch_http_request(callback=on_response)
+        for idx, event in enumerate(events):
+            # Use import_ instead of insert - this doesn't send notifications
+            batch.add(self.service.events().import_(calendarId=calendar_id, body=event),
+                      request_id=str(idx))
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            # The whole batch failed; anything without a response gets this error
+            for idx in range(len(events)):
+                responses.setdefault(str(idx), e)
+        
+        rate_limited = []
+        retry_after = 0
+        for idx, event in enumerate(events):
+            error = responses.get(str(idx))
+            ical_uid = event.get('iCalUID', '')
+            
+            if error is None:
+                counts['imported'] += 1
+                # Add to existing UIDs to prevent duplicates within same run
+                if ical_uid:
+                    existing_uids.add(ical_uid)
+            
+            elif isinstance(error, HttpError) and error.resp.status == 429:  # Rate limit exceeded
+                if retry:
+                    self._count_import_error(counts, f"Retry failed for '{event.get('summary', 'Unknown')}': {error}")
+                else:
+                    rate_limited.append(event)
+                    retry_after = max(retry_after, _retry_after_seconds(error))
+            
+            elif isinstance(error, HttpError) and error.resp.status == 409:  # Conflict - event already exists
+                counts['skipped'] += 1
+            
+            elif isinstance(error, HttpError) and error.resp.status == 400 and 'participantIsNeitherOrganizerNorAttendee' in str(error):
+                # User is not organizer or attendee - retry without attendees/organizer
+                # (taken out of the event for the request and put back after, no copy)
+                organizer = event.pop('organizer', None)
+                attendees = event.pop('attendees', None)
+                try:
+                    self.service.events().import_(
+                        calendarId=calendar_id,
+                        body=event
+                    ).execute()
+                    counts['imported'] += 1
+                    self.stats['imported_without_attendees'] = self.stats.get('imported_without_attendees', 0) + 1
+                    if ical_uid:
+                        existing_uids.add(ical_uid)
+                except Exception as retry_error:
+                    self._count_import_error(counts, f"Fallback failed for '{event.get('summary', 'Unknown')}': {retry_error}")
+                finally:
+                    if organizer is not None:
+                        event['organizer'] = organizer
+                    if attendees is not None:
+                        event['attendees'] = attendees
+            
+            else:
+                self._count_import_error(counts, f"Error importing '{event.get('summary', 'Unknown')}': {error}")
+        
+        if rate_limited:
+            print(f"\nRate limit hit, waiting {retry_after} seconds...")
+            time.sleep(retry_after)
+            self._import_batch(rate_limited, calendar_id, existing_uids, counts, retry=True)
+        
+        return bool(rate_limited)
+    
+    def _count_import_error(self, counts: Dict[str, int], message: str) -> None:
+        """Count an import error, printing only the first few"""
+        counts['errors'] += 1
+        if counts['errors'] <= 10:
+            print(message)
+        elif counts['errors'] == 11:
+            print("(Suppressing further error messages...)")
+    
+    def _get_existing_uids(self, calendar_id: str) -> UIDSet:
         """Get iCalUIDs of events already in the calendar"""
-        uids = set()
+        uids = UIDSet()
         page_token = None
         
         try:
@@ -814,7 +1200,9 @@ class GoogleCalendarImporter:
                     pageToken=page_token,
                     maxResults=2500,
                     singleEvents=False,
-                    showDeleted=False
+                    showDeleted=False,
+                    # Only the UIDs are needed, not the full events
+                    fields='nextPageToken,items(iCalUID,extendedProperties/private/outlookUID)'
                 ).execute()
                 
                 for event in events_result.get('items', []):
@@ -862,6 +1250,53 @@ class GoogleCalendarImporter:
             print("\nNOTE: No email notifications were sent to any attendees.")
 
 
+# Per-process state for _convert_vevent_chunk()
+_worker_importer = None
+_worker_timezones: Set[bytes] = set()
+
+
+def _convert_vevent_chunk(blocks: List[bytes], tz_blocks: Tuple[bytes, ...], calendar_tz: str,
+                          include_attendees: bool) -> Tuple[List[Tuple[Optional[Dict[str, Any]], Optional[str]]], int]:
+    """
+    Process pool worker: parse and convert a chunk of raw VEVENTs.
+    
+    Returns the (event, error message) results in input order, and the
+    number of attendees converted (the worker's stats aren't shared).
+    """
+    global _worker_importer
+    if _worker_importer is None:
+        _worker_importer = GoogleCalendarImporter()
+    
+    # Register the calendar's VTIMEZONEs in this process before its events
+    for raw in tz_blocks:
+        if raw not in _worker_timezones:
+            _worker_timezones.add(raw)
+            try:
+                Component.from_ical(raw)
+            except Exception:
+                pass
+    
+    attendees_before = _worker_importer.stats['attendees_imported']
+    results = [_worker_importer._convert_raw_vevent(raw, calendar_tz, include_attendees) for raw in blocks]
+    return results, _worker_importer.stats['attendees_imported'] - attendees_before
+
+
+def add_attendee_to_events(events: Iterable[Dict[str, Any]], email: str) -> Iterator[Dict[str, Any]]:
+    """Add email as an accepted attendee to each event that doesn't already list it"""
+    email_lower = email.lower()
+    for event in events:
+        attendees = event.get('attendees', [])
+        # Check if already in attendees list
+        emails = [a.get('email', '').lower() for a in attendees]
+        if email_lower not in emails:
+            attendees.append({
+                'email': email,
+                'responseStatus': 'accepted'
+            })
+            event['attendees'] = attendees
+        yield event
+
+
 def find_ics_files(path: str) -> List[str]:
     """Find all ICS files in a path (file or directory)"""
     path = Path(path)
@@ -874,8 +1309,11 @@ def find_ics_files(path: str) -> List[str]:
             return []
     
     elif path.is_dir():
-        ics_files = list(path.glob('*.ics')) + list(path.glob('*.ICS'))
-        return [str(f) for f in sorted(ics_files)]
+        # One directory read; matches any case of the extension and never
+        # lists a file twice on case-insensitive filesystems
+        with os.scandir(path) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.lower().endswith('.ics') and entry.is_file())
     
     else:
         print(f"Error: {path} not found")
@@ -940,12 +1378,15 @@ Notes:
     print("  ✓ Duplicate detection and skipping")
     print("=" * 60)
     
-    # Authenticate
-    print("\nAuthenticating with Google...")
-    sys.stdout.flush()
-    importer.authenticate()
-    print("Connected to Google Calendar API")
-    sys.stdout.flush()
+    # Authenticate (a dry run never calls the API, so it needs no credentials)
+    if args.dry_run and not args.list_calendars:
+        print("\nDry run: skipping Google authentication")
+        print(f"Floating times without a calendar timezone are previewed in {importer.default_timezone}, "
+              "not your Google Calendar's timezone")
+    else:
+        print("\nAuthenticating with Google...", flush=True)
+        importer.authenticate()
+        print("Connected to Google Calendar API")
     
     # List calendars if requested
     if args.list_calendars:
@@ -1002,42 +1443,40 @@ Notes:
     else:
         print("Attendee import: DISABLED")
     
-    # Process each file
+    # Fetch existing UIDs once so duplicates are skipped before parsing
+    existing_uids = None
+    skip_duplicates = not args.no_skip_duplicates
+    if skip_duplicates and not args.dry_run:
+        print("\nChecking for existing events...")
+        existing_uids = importer._get_existing_uids(args.calendar)
+        print(f"Found {len(existing_uids)} existing events")
+    
+    # Process each file - events stream from the parser straight into the import
     for ics_file in ics_files:
-        events, _ = importer.parse_ics_file(ics_file, include_attendees=not args.no_attendees)
-        
-        # Apply date filtering
-        if start_date or end_date:
-            original_count = len(events)
-            events = filter_events_by_date(events, start_date, end_date)
-            print(f"Date filter: {original_count} -> {len(events)} events")
+        events = (event for event, _ in importer.parse_ics_file(
+            ics_file,
+            include_attendees=not args.no_attendees,
+            start_date=start_date,
+            end_date=end_date,
+            skip_uids=existing_uids
+        ))
         
         # Apply limit
-        if args.limit and len(events) > args.limit:
-            events = events[:args.limit]
-            print(f"Limited to first {args.limit} events")
+        if args.limit:
+            events = islice(events, args.limit)
         
         # Add self as attendee if requested
         if args.add_self and not args.no_attendees:
             print(f"Adding {args.add_self} as attendee to all events...")
-            for event in events:
-                attendees = event.get('attendees', [])
-                # Check if already in attendees list
-                emails = [a.get('email', '').lower() for a in attendees]
-                if args.add_self.lower() not in emails:
-                    attendees.append({
-                        'email': args.add_self,
-                        'responseStatus': 'accepted'
-                    })
-                    event['attendees'] = attendees
-        
-        if events:
-            importer.import_events(
-                events,
-                calendar_id=args.calendar,
-                skip_duplicates=not args.no_skip_duplicates,
-                dry_run=args.dry_run
-            )
+            events = add_attendee_to_events(events, args.add_self)
+        
+        importer.import_events(
+            events,
+            calendar_id=args.calendar,
+            skip_duplicates=skip_duplicates,
+            dry_run=args.dry_run,
+            existing_uids=existing_uids
+        )
     
     # Print summary
     importer.print_summary()
@@ -9,12 +9,33 @@ Usage:
     python ics_validator.py <ics_file> [--samples 5]
 """
 
+import os
+import re
 import sys
 import random
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
-from icalendar import Calendar
+from datetime import datetime, date, timedelta, timezone
+from typing import List, Dict, Any, Optional, Iterator, BinaryIO, Tuple, Set
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from icalendar import Component
+
+from ics_common import PARALLEL_PARSE_MIN_BYTES, iter_ics_blocks, strip_mailto
+
+# Read buffer for ICS exports (often tens to hundreds of MB)
+READ_BUFFER_SIZE = 1024 * 1024
+
+# With --accurate, files of at least PARALLEL_PARSE_MIN_BYTES are parsed in
+# a process pool, PARSE_CHUNK_SIZE raw VEVENTs per task
+PARSE_CHUNK_SIZE = 500
+
+# RFC 5545 TEXT escapes (\n, \\, \;, \,) in SUMMARY/LOCATION/DESCRIPTION
+_TEXT_ESCAPE_RE = re.compile(r'\\([\\;,nN])')
+
+# TRIGGER durations such as -PT15M, -P1D, -P1DT2H
+_DURATION_RE = re.compile(
+    r'^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$'
+)
 
 # Timezone mappings (same as importer)
 TIMEZONE_MAPPINGS = {
@@ -55,46 +76,67 @@ TIMEZONE_MAPPINGS = {
     'Coordinated Universal Time': 'UTC',
 }
 
+# Lowercased once for the case-insensitive lookups in normalize_timezone
+_TZ_MAPPINGS_LOWER = {k.lower(): v for k, v in TIMEZONE_MAPPINGS.items()}
+
 
+@lru_cache(maxsize=512)
 def normalize_timezone(tz_str: str) -> str:
-    """Convert Windows timezone to IANA"""
+    """Convert Windows timezone to IANA (cached per name)"""
     if not tz_str:
         return 'UTC'
     if tz_str in TIMEZONE_MAPPINGS:
         return TIMEZONE_MAPPINGS[tz_str]
-    for win_tz, iana_tz in TIMEZONE_MAPPINGS.items():
-        if win_tz.lower() in tz_str.lower():
+    tz_lower = tz_str.lower()
+    if tz_lower in _TZ_MAPPINGS_LOWER:
+        return _TZ_MAPPINGS_LOWER[tz_lower]
+    for win_tz, iana_tz in _TZ_MAPPINGS_LOWER.items():
+        if win_tz in tz_lower:
             return iana_tz
     return tz_str  # Return as-is if unknown
 
 
+def _short(props: Dict[str, Any], key: str, limit: int) -> Optional[str]:
+    """First `limit` characters of a property's text, or None if missing/empty"""
+    value = props.get(key)
+    if not value:
+        return None
+    if isinstance(value, str):
+        # vText is a str subclass - slice it without copying the full value first
+        return value[:limit]
+    return str(value)[:limit]
+
+
 def get_event_info(vevent) -> Dict[str, Any]:
     """Extract key info from a VEVENT"""
     info = {}
     
+    # Read all properties in one pass instead of a lookup per field
+    props = {key.lower(): value for key, value in vevent.items()}
+    
     # Basic fields
-    info['summary'] = str(vevent.get('summary', '')) or '(no title)'
-    info['description'] = str(vevent.get('description', ''))[:200] if vevent.get('description') else None
-    info['location'] = str(vevent.get('location', ''))[:100] if vevent.get('location') else None
-    info['uid'] = str(vevent.get('uid', ''))[:50]
+    info['summary'] = str(props.get('summary', '')) or '(no title)'
+    info['description'] = _short(props, 'description', 200)
+    info['location'] = _short(props, 'location', 100)
+    info['uid'] = _short(props, 'uid', 50) or ''
     
     # Start/End
-    dtstart = vevent.get('dtstart')
+    dtstart = props.get('dtstart')
     if dtstart:
         info['start'] = dtstart.dt
         info['start_tz'] = dtstart.params.get('TZID') if hasattr(dtstart, 'params') else None
         info['is_all_day'] = isinstance(dtstart.dt, date) and not isinstance(dtstart.dt, datetime)
     
-    dtend = vevent.get('dtend')
+    dtend = props.get('dtend')
     if dtend:
         info['end'] = dtend.dt
     
     # Recurrence
-    rrule = vevent.get('rrule')
+    rrule = props.get('rrule')
     if rrule:
         info['rrule'] = rrule.to_ical().decode('utf-8')
     
-    exdate = vevent.get('exdate')
+    exdate = props.get('exdate')
     if exdate:
         info['has_exdate'] = True
         if isinstance(exdate, list):
@@ -105,7 +147,7 @@ def get_event_info(vevent) -> Dict[str, Any]:
             info['exdate_count'] = 1
     
     # Attendees
-    attendees = vevent.get('attendee')
+    attendees = props.get('attendee')
     if attendees:
         if not isinstance(attendees, list):
             attendees = [attendees]
@@ -113,7 +155,7 @@ def get_event_info(vevent) -> Dict[str, Any]:
         info['attendees'] = []
         for att in attendees[:5]:
             att_info = {
-                'email': str(att).replace('mailto:', '').replace('MAILTO:', '')
+                'email': strip_mailto(str(att))
             }
             if hasattr(att, 'params'):
                 att_info['name'] = att.params.get('CN', '')
@@ -121,15 +163,15 @@ def get_event_info(vevent) -> Dict[str, Any]:
             info['attendees'].append(att_info)
     
     # Organizer
-    organizer = vevent.get('organizer')
+    organizer = props.get('organizer')
     if organizer:
-        info['organizer'] = str(organizer).replace('mailto:', '').replace('MAILTO:', '')
+        info['organizer'] = strip_mailto(str(organizer))
         if hasattr(organizer, 'params') and organizer.params.get('CN'):
             info['organizer_name'] = organizer.params.get('CN')
     
     # Reminders
     reminders = []
-    for component in vevent.walk():
+    for component in vevent.subcomponents:
         if component.name == "VALARM":
             trigger = component.get('trigger')
             action = component.get('action')
@@ -144,103 +186,457 @@ def get_event_info(vevent) -> Dict[str, Any]:
         info['reminders'] = reminders
     
     # Status/Visibility
-    info['status'] = str(vevent.get('status', '')) or None
-    info['class'] = str(vevent.get('class', '')) or None
-    info['transp'] = str(vevent.get('transp', '')) or None
-    info['busystatus'] = str(vevent.get('x-microsoft-cdo-busystatus', '')) or None
+    info['status'] = str(props.get('status', '')) or None
+    info['class'] = str(props.get('class', '')) or None
+    info['transp'] = str(props.get('transp', '')) or None
+    info['busystatus'] = str(props.get('x-microsoft-cdo-busystatus', '')) or None
     
     return info
 
 
-def print_event(event: Dict[str, Any], index: int):
-    """Pretty print an event"""
-    print(f"\n  --- Sample {index} ---")
-    print(f"    Title:      {event['summary'][:60]}{'...' if len(event['summary']) > 60 else ''}")
+def iter_content_lines(f: BinaryIO) -> Iterator[str]:
+    """Yield unfolded content lines from an ICS byte stream"""
+    parts: List[bytes] = []
+    for line in f:
+        if line[:1] in (b' ', b'\t'):
+            # Folded continuation of the previous line
+            parts.append(line[1:].rstrip(b'\r\n'))
+            continue
+        if parts:
+            yield b''.join(parts).decode('utf-8', 'replace')
+        parts = [line.rstrip(b'\r\n')]
+    if parts:
+        yield b''.join(parts).decode('utf-8', 'replace')
+
+
+def _split_unquoted(text: str, sep: str) -> List[str]:
+    """Split on sep, ignoring separators inside double-quoted parameter values"""
+    if '"' not in text:
+        return text.split(sep)
+    pieces = []
+    start = 0
+    quoted = False
+    for i, ch in enumerate(text):
+        if ch == '"':
+            quoted = not quoted
+        elif ch == sep and not quoted:
+            pieces.append(text[start:i])
+            start = i + 1
+    pieces.append(text[start:])
+    return pieces
+
+
+def parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split a content line into (NAME, {PARAM: value}, value)"""
+    colon = line.find(':')
+    if colon == -1:
+        return line.upper(), {}, ''
+    
+    if '"' in line[:colon]:
+        # A quoted parameter (CN="Doe: Jane") can hide the real separator;
+        # the first piece is everything before the first unquoted colon
+        head = _split_unquoted(line, ':')[0]
+        colon = len(head)
+    
+    name, *raw_params = _split_unquoted(line[:colon], ';')
+    params = {}
+    for raw in raw_params:
+        key, _, val = raw.partition('=')
+        params[key.upper()] = val.strip('"')
+    return name.upper(), params, line[colon + 1:]
+
+
+def _unescape_text(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping"""
+    if '\\' not in value:
+        return value
+    return _TEXT_ESCAPE_RE.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
+
+def _parse_date_value(value: str, params: Dict[str, str]):
+    """Parse a DATE or DATE-TIME value; times with a TZID are left naive"""
+    value = value.strip()
+    if params.get('VALUE', '').upper() == 'DATE' or len(value) == 8:
+        return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    dt = datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                  int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    if value.endswith('Z'):
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_duration(value: str) -> Optional[timedelta]:
+    """Parse an RFC 5545 DURATION value (e.g. -PT15M)"""
+    match = _DURATION_RE.match(value.strip())
+    if not match:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    delta = timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                      minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -delta if sign == '-' else delta
+
+
+def _scanned_event_info(props: Dict[str, Tuple[Dict[str, str], str]],
+                        attendees: List[Tuple[Dict[str, str], str]],
+                        exdate_count: int,
+                        reminders: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the same info dict as get_event_info() from scanned properties"""
+    info = {}
+    
+    def text(key: str) -> str:
+        prop = props.get(key)
+        return _unescape_text(prop[1]) if prop else ''
+    
+    # Basic fields
+    info['summary'] = text('SUMMARY') or '(no title)'
+    description = text('DESCRIPTION')
+    info['description'] = description[:200] if description else None
+    location = text('LOCATION')
+    info['location'] = location[:100] if location else None
+    info['uid'] = props['UID'][1][:50] if 'UID' in props else ''
+    
+    # Start/End
+    if 'DTSTART' in props:
+        params, value = props['DTSTART']
+        try:
+            start = _parse_date_value(value, params)
+        except ValueError:
+            start = None
+        if start:
+            info['start'] = start
+            info['start_tz'] = params.get('TZID')
+            info['is_all_day'] = not isinstance(start, datetime)
+    
+    if 'DTEND' in props:
+        params, value = props['DTEND']
+        try:
+            info['end'] = _parse_date_value(value, params)
+        except ValueError:
+            pass
+    
+    # Recurrence
+    rrule = props.get('RRULE')
+    if rrule and rrule[1]:
+        info['rrule'] = rrule[1]
+    
+    if exdate_count:
+        info['has_exdate'] = True
+        info['exdate_count'] = exdate_count
+    
+    # Attendees
+    if attendees:
+        info['attendee_count'] = len(attendees)
+        info['attendees'] = [
+            {
+                'email': strip_mailto(value),
+                'name': params.get('CN', ''),
+                'status': params.get('PARTSTAT', 'UNKNOWN'),
+            }
+            for params, value in attendees[:5]
+        ]
+    
+    # Organizer
+    organizer = props.get('ORGANIZER')
+    if organizer and organizer[1]:
+        params, value = organizer
+        info['organizer'] = strip_mailto(value)
+        if params.get('CN'):
+            info['organizer_name'] = params['CN']
+    
+    if reminders:
+        info['reminders'] = reminders
+    
+    # Status/Visibility
+    info['status'] = text('STATUS') or None
+    info['class'] = text('CLASS') or None
+    info['transp'] = text('TRANSP') or None
+    info['busystatus'] = text('X-MICROSOFT-CDO-BUSYSTATUS') or None
+    
+    return info
+
+
+def scan_events(f: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Stream VEVENTs from an ICS byte stream as get_event_info() dicts.
+    
+    Reads one unfolded content line at a time and keeps only the
+    properties the validator reports on, so memory is bounded by a single
+    event rather than the whole parsed calendar. DATE-TIME values with a
+    TZID come back naive (the TZID is still reported as 'start_tz'); use
+    --accurate to resolve them through icalendar instead.
+    """
+    props: Optional[Dict[str, Tuple[Dict[str, str], str]]] = None
+    attendees: List[Tuple[Dict[str, str], str]] = []
+    reminders: List[Dict[str, Any]] = []
+    exdate_count = 0
+    alarm: Optional[Dict[str, str]] = None
+    depth = 0  # components open inside the current VEVENT
+    
+    for line in iter_content_lines(f):
+        name, params, value = parse_content_line(line)
+        
+        if name == 'BEGIN':
+            if props is None:
+                if value.strip().upper() == 'VEVENT':
+                    props, attendees, reminders, exdate_count = {}, [], [], 0
+            else:
+                depth += 1
+                if depth == 1 and value.strip().upper() == 'VALARM':
+                    alarm = {}
+            continue
+        
+        if name == 'END':
+            if props is None:
+                continue
+            if depth:
+                if depth == 1 and alarm is not None:
+                    duration = _parse_duration(alarm.get('TRIGGER', ''))
+                    if duration is not None:
+                        reminders.append({
+                            'minutes': abs(int(duration.total_seconds() / 60)),
+                            'action': alarm.get('ACTION') or 'DISPLAY'
+                        })
+                    alarm = None
+                depth -= 1
+            else:
+                yield _scanned_event_info(props, attendees, exdate_count, reminders)
+                props = None
+            continue
+        
+        if props is None:
+            continue
+        if depth:
+            if alarm is not None and depth == 1 and name not in alarm:
+                # Absolute (VALUE=DATE-TIME) triggers fail the duration match
+                alarm[name] = value
+            continue
+        
+        if name == 'ATTENDEE':
+            attendees.append((params, value))
+        elif name == 'EXDATE':
+            exdate_count += value.count(',') + 1
+        elif name not in props:
+            props[name] = (params, value)
+
+
+def _iter_vevent_chunks(f: BinaryIO) -> Iterator[Tuple[Tuple[bytes, ...], List[bytes]]]:
+    """Read raw VEVENTs in chunks of PARSE_CHUNK_SIZE, each with the VTIMEZONEs seen so far"""
+    tz_blocks: List[bytes] = []
+    pending: List[bytes] = []
+    for name, raw in iter_ics_blocks(f):
+        if name == 'VEVENT':
+            pending.append(raw)
+            if len(pending) >= PARSE_CHUNK_SIZE:
+                yield tuple(tz_blocks), pending
+                pending = []
+        elif name == 'VTIMEZONE':
+            tz_blocks.append(raw)
+    if pending:
+        yield tuple(tz_blocks), pending
+
+
+# VTIMEZONE blocks already registered in this process
+_worker_timezones: Set[bytes] = set()
+
+
+def _event_infos_from_chunk(chunk: Tuple[Tuple[bytes, ...], List[bytes]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Parse a chunk of raw VEVENTs with icalendar (run in pool workers for
+    large files).
+    
+    Returns the get_event_info() dicts in input order, and an error
+    message for each VEVENT that could not be parsed.
+    """
+    tz_blocks, blocks = chunk
+    
+    # Register the calendar's VTIMEZONEs in this process before its events
+    for raw in tz_blocks:
+        if raw not in _worker_timezones:
+            _worker_timezones.add(raw)
+            try:
+                Component.from_ical(raw)
+            except Exception:
+                pass
+    
+    infos = []
+    errors = []
+    for raw in blocks:
+        try:
+            infos.append(get_event_info(Component.from_ical(raw)))
+        except Exception as e:
+            errors.append(str(e))
+    return infos, errors
+
+
+def _chunk_results(infos: List[Dict[str, Any]], errors: List[str]) -> Iterator[Dict[str, Any]]:
+    """Report a parsed chunk's errors, then yield its event infos"""
+    for error in errors:
+        print(f"Warning: Could not parse event: {error}")
+    yield from infos
+
+
+def iter_event_infos(ics_path: str, accurate: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield get_event_info() dicts for every VEVENT in an ICS file.
+    
+    Either way the file is streamed: the line scanner by default, or with
+    accurate=True icalendar on one VEVENT block at a time (in a process
+    pool for large files), never the whole calendar tree at once.
+    """
+    with open(ics_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        if not accurate:
+            yield from scan_events(f)
+            return
+        
+        executor = None
+        max_in_flight = 0
+        workers = os.cpu_count() or 1
+        if workers > 1 and os.fstat(f.fileno()).st_size >= PARALLEL_PARSE_MIN_BYTES:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            max_in_flight = workers * 2
+        
+        # Only a few chunks are submitted ahead of the ones being consumed,
+        # so large files are never read into memory all at once
+        in_flight = deque()
+        try:
+            for chunk in _iter_vevent_chunks(f):
+                if executor is None:
+                    yield from _chunk_results(*_event_infos_from_chunk(chunk))
+                    continue
+                
+                in_flight.append(executor.submit(_event_infos_from_chunk, chunk))
+                while len(in_flight) > max_in_flight:
+                    yield from _chunk_results(*in_flight.popleft().result())
+            
+            while in_flight:
+                yield from _chunk_results(*in_flight.popleft().result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+
+def format_event(event: Dict[str, Any], index: int) -> str:
+    """Format an event as one block of text for print_event"""
+    lines = []
+    lines.append(f"\n  --- Sample {index} ---")
+    lines.append(f"    Title:      {event['summary'][:60]}{'...' if len(event['summary']) > 60 else ''}")
     
     if event.get('start'):
         if event.get('is_all_day'):
-            print(f"    Start:      {event['start']} (all-day)")
+            lines.append(f"    Start:      {event['start']} (all-day)")
         else:
             tz = event.get('start_tz', 'UTC')
             tz_mapped = normalize_timezone(tz) if tz else 'UTC'
-            print(f"    Start:      {event['start']}")
+            lines.append(f"    Start:      {event['start']}")
             if tz:
-                print(f"    Timezone:   {tz} → {tz_mapped}")
+                lines.append(f"    Timezone:   {tz} → {tz_mapped}")
     
     if event.get('end'):
-        print(f"    End:        {event['end']}")
+        lines.append(f"    End:        {event['end']}")
     
     if event.get('location'):
-        print(f"    Location:   {event['location'][:70]}{'...' if len(event['location']) > 70 else ''}")
+        lines.append(f"    Location:   {event['location'][:70]}{'...' if len(event['location']) > 70 else ''}")
     
     if event.get('rrule'):
-        print(f"    Recurrence: {event['rrule'][:60]}{'...' if len(event['rrule']) > 60 else ''}")
+        lines.append(f"    Recurrence: {event['rrule'][:60]}{'...' if len(event['rrule']) > 60 else ''}")
         if event.get('has_exdate'):
-            print(f"    Exceptions: {event['exdate_count']} dates excluded")
+            lines.append(f"    Exceptions: {event['exdate_count']} dates excluded")
     
     if event.get('organizer'):
         org_name = f" ({event['organizer_name']})" if event.get('organizer_name') else ''
-        print(f"    Organizer:  {event['organizer']}{org_name}")
+        lines.append(f"    Organizer:  {event['organizer']}{org_name}")
     
     if event.get('attendee_count'):
-        print(f"    Attendees:  {event['attendee_count']} total")
+        lines.append(f"    Attendees:  {event['attendee_count']} total")
         for att in event.get('attendees', [])[:3]:
             name = f" ({att['name']})" if att.get('name') else ''
             status = att.get('status', 'UNKNOWN')
-            print(f"                - {att['email']}{name} [{status}]")
+            lines.append(f"                - {att['email']}{name} [{status}]")
         if event['attendee_count'] > 3:
-            print(f"                ... and {event['attendee_count'] - 3} more")
+            lines.append(f"                ... and {event['attendee_count'] - 3} more")
     
     if event.get('reminders'):
         rem_strs = [f"{r['minutes']}min ({r['action']})" for r in event['reminders'][:3]]
-        print(f"    Reminders:  {', '.join(rem_strs)}")
+        lines.append(f"    Reminders:  {', '.join(rem_strs)}")
     
     if event.get('class') and event['class'] != 'PUBLIC':
-        print(f"    Visibility: {event['class']}")
+        lines.append(f"    Visibility: {event['class']}")
     
     if event.get('description'):
         desc = event['description'].replace('\n', ' ')[:100]
-        print(f"    Description: {desc}{'...' if len(event['description']) > 100 else ''}")
+        lines.append(f"    Description: {desc}{'...' if len(event['description']) > 100 else ''}")
+    
+    return "\n".join(lines)
+
+
+def print_event(event: Dict[str, Any], index: int):
+    """Pretty print an event with a single write"""
+    sys.stdout.write(format_event(event, index) + "\n")
+
+
+class Reservoir:
+    """Uniform random sample of up to k items from a stream (Algorithm R)"""
+    
+    def __init__(self, k: int):
+        self.k = k
+        self.count = 0
+        self.items: List[Any] = []
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def offer(self, item: Any) -> None:
+        self.count += 1
+        if len(self.items) < self.k:
+            self.items.append(item)
+            return
+        j = random.randrange(self.count)
+        if j < self.k:
+            self.items[j] = item
 
 
-def validate_ics(ics_path: str, samples_per_category: int = 5):
+def validate_ics(ics_path: str, samples_per_category: int = 5, accurate: bool = False):
     """Main validation function"""
     
     print(f"Loading: {ics_path}")
     
-    with open(ics_path, 'rb') as f:
-        cal = Calendar.from_ical(f.read())
-    
-    # Categorize events
-    all_events = []
-    events_with_attendees = []
-    events_recurring = []
-    events_with_reminders = []
-    events_all_day = []
-    events_timed = []
-    events_private = []
-    events_with_location = []
-    events_old = []  # Before 2020
-    events_recent = []  # 2024 or later
-    events_long_description = []
+    # Categorize events; each category keeps only a random sample plus its count
+    total_events = 0
+    events_with_attendees = Reservoir(samples_per_category)
+    events_recurring = Reservoir(samples_per_category)
+    events_with_reminders = Reservoir(samples_per_category)
+    events_all_day = Reservoir(samples_per_category)
+    events_timed = Reservoir(samples_per_category)
+    events_private = Reservoir(samples_per_category)
+    events_with_location = Reservoir(samples_per_category)
+    events_old = Reservoir(samples_per_category)  # Before 2020
+    events_recent = Reservoir(samples_per_category)  # 2024 or later
+    events_long_description = Reservoir(samples_per_category)
     
     # Additional edge case categories
     events_many_attendees = []  # Events with 50+ attendees
     events_invalid_organizer = []
     events_long_title = []
     events_no_end = []
-    duplicate_uids = defaultdict(list)
+    uid_counts = Counter()
+    distribution_lists = set()
+    resource_calendars = set()
     
-    for component in cal.walk():
-        if component.name != "VEVENT":
-            continue
-        
-        info = get_event_info(component)
-        all_events.append(info)
+    for info in iter_event_infos(ics_path, accurate):
+        total_events += 1
         
         # Track UIDs for duplicates
         if info.get('uid'):
-            duplicate_uids[info['uid']].append(info)
+            uid_counts[info['uid']] += 1
+        
+        # Collect distribution lists and resource calendars
+        for att in info.get('attendees', ()):
+            email = att.get('email', '')
+            email_lower = email.lower()
+            if email_lower.startswith('dl-'):
+                distribution_lists.add(email)
+            if '@resource.calendar.google.com' in email_lower:
+                resource_calendars.add(email)
         
         # Check for many attendees
         if info.get('attendee_count', 0) >= 50:
@@ -260,46 +656,43 @@ def validate_ics(ics_path: str, samples_per_category: int = 5):
         
         # Categorize
         if info.get('attendee_count'):
-            events_with_attendees.append(info)
+            events_with_attendees.offer(info)
         
         if info.get('rrule'):
-            events_recurring.append(info)
+            events_recurring.offer(info)
         
         if info.get('reminders'):
-            events_with_reminders.append(info)
+            events_with_reminders.offer(info)
         
         if info.get('is_all_day'):
-            events_all_day.append(info)
+            events_all_day.offer(info)
         else:
-            events_timed.append(info)
+            events_timed.offer(info)
         
         if info.get('class') in ['PRIVATE', 'CONFIDENTIAL']:
-            events_private.append(info)
+            events_private.offer(info)
         
         if info.get('location'):
-            events_with_location.append(info)
+            events_with_location.offer(info)
         
-        # Date-based categorization
+        # Date-based categorization (datetime is a date subclass)
         start = info.get('start')
-        if start:
-            try:
-                year = start.year if hasattr(start, 'year') else None
-                if year and year < 2020:
-                    events_old.append(info)
-                elif year and year >= 2024:
-                    events_recent.append(info)
-            except:
-                pass
+        year = start.year if isinstance(start, date) else 0
+        if year:
+            if year < 2020:
+                events_old.offer(info)
+            elif year >= 2024:
+                events_recent.offer(info)
         
         if info.get('description') and len(info['description']) > 150:
-            events_long_description.append(info)
+            events_long_description.offer(info)
     
     # Print report
     print("\n" + "=" * 70)
     print("PRE-IMPORT VALIDATION REPORT")
     print("=" * 70)
     
-    print(f"\nTotal events: {len(all_events)}")
+    print(f"\nTotal events: {total_events}")
     
     categories = [
         ("EVENTS WITH ATTENDEES", events_with_attendees, 
@@ -336,10 +729,8 @@ def validate_ics(ics_path: str, samples_per_category: int = 5):
             print("  (none found)")
             continue
         
-        # Random sample
-        sample = random.sample(events, min(samples_per_category, len(events)))
-        
-        for i, event in enumerate(sample, 1):
+        # Random sample, drawn while scanning
+        for i, event in enumerate(events.items, 1):
             print_event(event, i)
             
             # Validation checks
@@ -361,7 +752,7 @@ def validate_ics(ics_path: str, samples_per_category: int = 5):
     print("VALIDATION SUMMARY")
     print("=" * 70)
     
-    print(f"\n✓ Events with attendees:    {len(events_with_attendees):,} ({len(events_with_attendees)/len(all_events)*100:.1f}%)")
+    print(f"\n✓ Events with attendees:    {len(events_with_attendees):,} ({len(events_with_attendees)/total_events*100:.1f}%)")
     print(f"✓ Recurring events:         {len(events_recurring):,}")
     print(f"✓ Events with reminders:    {len(events_with_reminders):,}")
     print(f"✓ All-day events:           {len(events_all_day):,}")
@@ -372,18 +763,7 @@ def validate_ics(ics_path: str, samples_per_category: int = 5):
     print(f"✓ Recent events (2024+):    {len(events_recent):,}")
     
     # Edge case summary
-    actual_duplicates = {uid: evts for uid, evts in duplicate_uids.items() if len(evts) > 1}
-    
-    # Collect distribution lists
-    distribution_lists = set()
-    resource_calendars = set()
-    for event in all_events:
-        for att in event.get('attendees', []):
-            email = att.get('email', '')
-            if email.lower().startswith('dl-'):
-                distribution_lists.add(email)
-            if '@resource.calendar.google.com' in email.lower():
-                resource_calendars.add(email)
+    actual_duplicates = {uid: count for uid, count in uid_counts.items() if count > 1}
     
     print("\n" + "-" * 70)
     print("EDGE CASES")
@@ -461,9 +841,11 @@ def main():
     parser.add_argument('ics_path', help='Path to ICS file')
     parser.add_argument('--samples', '-s', type=int, default=5,
                         help='Number of samples per category (default: 5)')
+    parser.add_argument('--accurate', action='store_true',
+                        help='Parse each event with icalendar (slower; resolves TZID times)')
     
     args = parser.parse_args()
-    validate_ics(args.ics_path, args.samples)
+    validate_ics(args.ics_path, args.samples, args.accurate)
 
 
 if __name__ == '__main__':
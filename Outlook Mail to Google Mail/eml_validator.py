@@ -20,15 +20,36 @@ Usage:
 import os
 import sys
 import argparse
-import email
 import hashlib
+import json
 import random
+import sqlite3
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
+from email.parser import BytesParser
 from email.utils import parsedate_to_datetime
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Initial read when looking for the end of the header block
+HEADER_READ_SIZE = 16 * 1024
+
+# Problematic attachment filename characters, as a translate() deletion table
+_BAD_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
 
 class ValidationResult:
     """Store validation results for a single message"""
@@ -59,10 +80,17 @@ class EMLValidator:
     MAX_MESSAGE_SIZE = 25 * 1024 * 1024  # 25 MB
     MAX_RECIPIENTS = 500
 
-    def __init__(self):
+    # Below this many files the worker pool startup costs more than it saves
+    PARALLEL_MIN_FILES = 200
+    PARALLEL_CHUNK_SIZE = 64
+
+    # Checkpoint rows are written in one transaction per this many files
+    STATE_COMMIT_INTERVAL = 1000
+
+    def __init__(self, state_db: Optional[str] = None):
         self.results: List[ValidationResult] = []
-        self.seen_ids: Set[str] = set()
-        self.duplicates: List[Tuple[str, str]] = []  # (path, message_id)
+        self.seen_ids: Set[Union[str, bytes]] = set()  # Message-IDs and pseudo-ID digests
+        self.duplicates: List[Tuple[str, Union[str, bytes]]] = []  # (path, message_id)
         self.stats = {
             'total': 0,
             'valid': 0,
@@ -71,6 +99,39 @@ class EMLValidator:
             'duplicates': 0,
         }
 
+        # Optional SQLite checkpoint so an interrupted directory run can resume
+        self.state_db: Optional[sqlite3.Connection] = None
+        self.validated_paths: Set[str] = set()
+        if state_db:
+            self._open_state_db(state_db)
+
+    def _open_state_db(self, state_db: str):
+        """Open (or create) the checkpoint database and reload earlier progress"""
+        self.state_db = sqlite3.connect(state_db)
+        self.state_db.execute('PRAGMA journal_mode=WAL')
+        self.state_db.execute('PRAGMA synchronous=NORMAL')
+        # No type on msg_key: Message-IDs are TEXT, pseudo-IDs are BLOB digests
+        self.state_db.execute('CREATE TABLE IF NOT EXISTS seen (msg_key PRIMARY KEY, path TEXT)')
+        self.state_db.execute(
+            'CREATE TABLE IF NOT EXISTS validated '
+            '(path TEXT PRIMARY KEY, errors TEXT, warnings TEXT, duplicate_key)'
+        )
+        self.state_db.commit()
+
+        self.seen_ids.update(key for (key,) in self.state_db.execute('SELECT msg_key FROM seen'))
+
+        rows = self.state_db.execute('SELECT path, errors, warnings, duplicate_key FROM validated')
+        for path, errors, warnings, duplicate_key in rows:
+            result = ValidationResult(path)
+            result.errors = json.loads(errors)
+            result.warnings = json.loads(warnings)
+            if duplicate_key is not None:
+                self.duplicates.append((path, duplicate_key))
+                self.stats['duplicates'] += 1
+            self.results.append(result)
+            self._update_stats(result)
+            self.validated_paths.add(path)
+
     def validate_directory(self, directory: str, sample: int = 0) -> Dict[str, Any]:
         """Validate all EML files in a directory"""
         directory = Path(directory)
@@ -91,14 +152,61 @@ class EMLValidator:
         else:
             print(f"Validating {len(eml_files)} EML files...")
 
-        for i, eml_file in enumerate(eml_files):
-            self._validate_eml_file(eml_file)
-
-            if (i + 1) % 1000 == 0:
-                print(f"  Validated {i + 1}/{len(eml_files)}...")
+        if self.validated_paths:
+            eml_files = [f for f in eml_files if str(f) not in self.validated_paths]
+            print(f"Resuming: {len(self.validated_paths)} files already validated, "
+                  f"{len(eml_files)} remaining")
+
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(eml_files) >= self.PARALLEL_MIN_FILES:
+            # Parsing is CPU-bound and per-file pure; duplicate detection
+            # stays here in the main process where seen_ids lives
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                checked = executor.map(validate_eml_file, eml_files,
+                                       chunksize=self.PARALLEL_CHUNK_SIZE)
+                self._collect(checked, len(eml_files))
+        else:
+            self._collect(map(validate_eml_file, eml_files), len(eml_files))
 
         return self.stats
 
+    def _collect(self, checked, total: int):
+        """Record (result, Message-ID, pseudo-ID) tuples in file order"""
+        seen_rows = []
+        validated_rows = []
+
+        try:
+            for i, (result, msg_id, pseudo_id) in enumerate(checked):
+                is_duplicate = self._check_duplicate(result, msg_id, pseudo_id)
+                self.results.append(result)
+                self._update_stats(result)
+
+                if self.state_db is not None:
+                    msg_key = msg_id or pseudo_id or None
+                    if msg_key is not None and not is_duplicate:
+                        seen_rows.append((msg_key, result.path))
+                    validated_rows.append((result.path, json.dumps(result.errors),
+                                           json.dumps(result.warnings),
+                                           msg_key if is_duplicate else None))
+                    if len(validated_rows) >= self.STATE_COMMIT_INTERVAL:
+                        self._save_state(seen_rows, validated_rows)
+
+                if (i + 1) % 1000 == 0:
+                    print(f"  Validated {i + 1}/{total}...")
+        finally:
+            # Keep whatever was validated before an interruption
+            if validated_rows:
+                self._save_state(seen_rows, validated_rows)
+
+    def _save_state(self, seen_rows: List[tuple], validated_rows: List[tuple]):
+        """Write pending checkpoint rows in a single transaction and clear them"""
+        with self.state_db:
+            self.state_db.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?)', seen_rows)
+            self.state_db.executemany('INSERT OR REPLACE INTO validated VALUES (?, ?, ?, ?)',
+                                      validated_rows)
+        seen_rows.clear()
+        validated_rows.clear()
+
     def validate_mbox(self, mbox_path: str, sample: int = 0) -> Dict[str, Any]:
         """Validate all messages in an MBOX file"""
         import mailbox
@@ -112,63 +220,66 @@ class EMLValidator:
 
         try:
             mbox = mailbox.mbox(str(mbox_path))
-            messages = list(mbox)
+            # Keys are just message offsets; messages are read one at a time
+            keys = mbox.keys()
 
             # Sample if requested
-            if sample > 0 and len(messages) > sample:
-                print(f"Sampling {sample} of {len(messages)} messages...")
-                messages = random.sample(messages, sample)
+            if sample > 0 and len(keys) > sample:
+                print(f"Sampling {sample} of {len(keys)} messages...")
+                keys = random.sample(keys, sample)
             else:
-                print(f"Validating {len(messages)} messages...")
+                print(f"Validating {len(keys)} messages...")
 
-            for i, message in enumerate(messages):
-                result = self._validate_message(message, f"mbox:{i}")
+            for i, key in enumerate(keys):
+                result = self._validate_message(mbox.get_message(key), f"mbox:{i}")
                 self.results.append(result)
                 self._update_stats(result)
 
                 if (i + 1) % 1000 == 0:
-                    print(f"  Validated {i + 1}/{len(messages)}...")
+                    print(f"  Validated {i + 1}/{len(keys)}...")
 
         except Exception as e:
             print(f"Error reading MBOX: {e}")
 
         return self.stats
 
-    def _validate_eml_file(self, eml_path: Path):
-        """Validate a single EML file"""
-        result = ValidationResult(str(eml_path))
-
-        try:
-            # Check file size
-            file_size = eml_path.stat().st_size
-            if file_size > self.MAX_MESSAGE_SIZE:
-                result.add_error(f"Message too large: {file_size / 1024 / 1024:.1f} MB (max 25 MB)")
-
-            if file_size == 0:
-                result.add_error("Empty file")
-                self.results.append(result)
-                self._update_stats(result)
-                return
-
-            # Parse the message
-            with open(eml_path, 'rb') as f:
-                msg = email.message_from_binary_file(f)
-                self._validate_message_content(msg, result)
-
-        except Exception as e:
-            result.add_error(f"Parse error: {e}")
-
-        self.results.append(result)
-        self._update_stats(result)
-
     def _validate_message(self, msg, path: str) -> ValidationResult:
         """Validate a message object"""
         result = ValidationResult(path)
         self._validate_message_content(msg, result)
+        self._check_duplicate(result, *self._message_ids(msg))
         return result
 
-    def _validate_message_content(self, msg, result: ValidationResult):
-        """Validate message content"""
+    def _check_duplicate(self, result: ValidationResult, msg_id: str, pseudo_id: bytes) -> bool:
+        """Check Message-ID (or content pseudo-ID) against messages seen so far"""
+        if msg_id:
+            if msg_id in self.seen_ids:
+                result.add_warning("Duplicate Message-ID detected")
+                self.duplicates.append((result.path, msg_id))
+                self.stats['duplicates'] += 1
+                return True
+            self.seen_ids.add(msg_id)
+        elif pseudo_id:
+            if pseudo_id in self.seen_ids:
+                result.add_warning("Likely duplicate (same content hash)")
+                self.duplicates.append((result.path, pseudo_id))
+                self.stats['duplicates'] += 1
+                return True
+            self.seen_ids.add(pseudo_id)
+        return False
+
+    @classmethod
+    def _message_ids(cls, msg) -> Tuple[str, bytes]:
+        """Return (Message-ID, pseudo-ID); the pseudo-ID is only generated without a Message-ID"""
+        # str(): an 8-bit Message-ID comes back as an (unhashable) Header
+        msg_id = str(msg.get('Message-ID', ''))
+        if msg_id:
+            return msg_id, b''
+        return '', cls._generate_pseudo_id(msg)
+
+    @classmethod
+    def _validate_message_content(cls, msg, result: ValidationResult):
+        """Validate message content (duplicate detection is done separately)"""
 
         # Check for required headers
         if not msg.get('From'):
@@ -187,34 +298,15 @@ class EMLValidator:
             except Exception:
                 result.add_warning(f"Invalid Date format: {date_str[:50]}")
 
-        # Check Message-ID for duplicates
-        msg_id = msg.get('Message-ID', '')
-        if msg_id:
-            if msg_id in self.seen_ids:
-                result.add_warning("Duplicate Message-ID detected")
-                self.duplicates.append((result.path, msg_id))
-                self.stats['duplicates'] += 1
-            else:
-                self.seen_ids.add(msg_id)
-        else:
-            # Generate a pseudo-ID from content for duplicate detection
-            pseudo_id = self._generate_pseudo_id(msg)
-            if pseudo_id in self.seen_ids:
-                result.add_warning("Likely duplicate (same content hash)")
-                self.duplicates.append((result.path, pseudo_id))
-                self.stats['duplicates'] += 1
-            else:
-                self.seen_ids.add(pseudo_id)
-
-        # Check recipient count
-        all_recipients = []
+        # Check recipient count (comma-separated entries, counted without splitting)
+        recipient_count = 0
         for header in ['To', 'Cc', 'Bcc']:
             recips = msg.get(header, '')
             if recips:
-                all_recipients.extend(recips.split(','))
+                recipient_count += recips.count(',') + 1
 
-        if len(all_recipients) > self.MAX_RECIPIENTS:
-            result.add_warning(f"Many recipients: {len(all_recipients)} (may be slow to process)")
+        if recipient_count > cls.MAX_RECIPIENTS:
+            result.add_warning(f"Many recipients: {recipient_count} (may be slow to process)")
 
         # Check for encoding issues
         subject = msg.get('Subject', '')
@@ -243,18 +335,22 @@ class EMLValidator:
                     # Check for potentially problematic filenames
                     if len(filename) > 255:
                         result.add_warning(f"Long attachment filename: {len(filename)} chars")
-                    if any(c in filename for c in ['<', '>', ':', '"', '/', '\\', '|', '?', '*']):
+                    if len(filename.translate(_BAD_FILENAME_CHARS)) != len(filename):
                         result.add_warning(f"Special characters in attachment filename: {filename[:50]}")
 
-    def _generate_pseudo_id(self, msg) -> str:
-        """Generate a pseudo Message-ID from message content"""
+    @staticmethod
+    def _generate_pseudo_id(msg) -> bytes:
+        """Generate a pseudo Message-ID digest from message content"""
         key_parts = [
             msg.get('From', ''),
             msg.get('Date', ''),
             msg.get('Subject', ''),
         ]
         content = '|'.join(key_parts).encode('utf-8', errors='ignore')
-        return hashlib.md5(content).hexdigest()
+        # Only used as a set key, so a fast non-cryptographic raw digest will do
+        if HAS_XXHASH:
+            return xxhash.xxh3_128(content).digest()
+        return hashlib.blake2b(content, digest_size=16).digest()
 
     def _update_stats(self, result: ValidationResult):
         """Update statistics from a validation result"""
@@ -331,6 +427,65 @@ class EMLValidator:
         return [r.path for r in self.results if r.errors]
 
 
+def dump_json(obj: Any) -> str:
+    """Serialize a report dict as indented JSON, using orjson when installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def _read_header_block(f) -> bytes:
+    """Read up to the blank line ending the headers, without reading the body"""
+    data = f.read(HEADER_READ_SIZE)
+    ends = []
+    for sep in (b'\r\n\r\n', b'\n\n'):
+        pos = data.find(sep)
+        if pos >= 0:
+            ends.append(pos + len(sep))
+    if ends:
+        return data[:min(ends)]
+    # Unusually long headers (or no body at all): fall back to the whole file
+    return data + f.read()
+
+
+def validate_eml_file(eml_path: Path) -> Tuple[ValidationResult, str, bytes]:
+    """
+    Validate a single EML file without touching any validator state.
+
+    Module-level so it can be pickled to ProcessPoolExecutor workers.
+    Returns the result plus the Message-ID and pseudo-ID used for duplicate
+    detection, both empty if the file could not be parsed.
+    """
+    result = ValidationResult(str(eml_path))
+    msg_id = ''
+    pseudo_id = b''
+
+    try:
+        # Check file size
+        file_size = eml_path.stat().st_size
+        if file_size > EMLValidator.MAX_MESSAGE_SIZE:
+            result.add_error(f"Message too large: {file_size / 1024 / 1024:.1f} MB (max 25 MB)")
+
+        if file_size == 0:
+            result.add_error("Empty file")
+            return result, msg_id, pseudo_id
+
+        # Parse the message; single-part messages only need the header block
+        with open(eml_path, 'rb') as f:
+            msg = BytesParser().parsebytes(_read_header_block(f), headersonly=True)
+            if msg.get_content_maintype() == 'multipart':
+                # Attachment checks walk the parts, so only these need the full MIME tree
+                f.seek(0)
+                msg = BytesParser().parse(f)
+            msg_id, pseudo_id = EMLValidator._message_ids(msg)
+            EMLValidator._validate_message_content(msg, result)
+
+    except Exception as e:
+        result.add_error(f"Parse error: {e}")
+
+    return result, msg_id, pseudo_id
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Validate EML/MBOX files before Gmail migration',
@@ -351,6 +506,8 @@ Examples:
                         help='Output results as JSON')
     parser.add_argument('--list-errors', action='store_true',
                         help='Only list files with errors')
+    parser.add_argument('--state-db', metavar='FILE',
+                        help='SQLite checkpoint file; rerun with the same file to resume an interrupted directory run')
 
     args = parser.parse_args()
 
@@ -360,7 +517,7 @@ Examples:
         print(f"Error: Path not found: {path}")
         sys.exit(1)
 
-    validator = EMLValidator()
+    validator = EMLValidator(state_db=args.state_db)
 
     # Detect format and validate
     if path.is_file():
@@ -383,13 +540,12 @@ Examples:
 
     # Output
     if args.json:
-        import json
         output = {
             'stats': validator.stats,
             'errors': [r.path for r in validator.results if r.errors],
             'warnings': [r.path for r in validator.results if r.warnings and not r.errors],
         }
-        print(json.dumps(output, indent=2))
+        print(dump_json(output))
     elif args.list_errors:
         for path in validator.get_problematic_files():
             print(path)
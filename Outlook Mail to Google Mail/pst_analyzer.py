@@ -25,22 +25,52 @@ import tempfile
 import email
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
-from email.utils import parsedate_to_datetime
+from email.utils import getaddresses, parsedate_to_datetime
+
+# Full-width bar for the by-year histogram; rows are sliced from it
+HISTOGRAM_BAR = '#' * 50
+
+
+def _scan_eml_files(directory: Path):
+    """
+    Yield (path, folder, size) for every .eml file under directory.
+
+    One os.scandir walk; folder is the '/'-joined path relative to directory
+    ('' for top-level files).
+    """
+    pending = [(str(directory), '')]
+    while pending:
+        current, folder = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Symlinked directories are not followed (same as rglob)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, f"{folder}/{entry.name}" if folder else entry.name))
+                    elif entry.name.endswith('.eml') and entry.is_file():
+                        yield entry.path, folder, entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
 
 
 class MailAnalyzer:
     """Analyze email archives"""
 
+    # Below this many files the worker pool startup costs more than it saves
+    PARALLEL_MIN_FILES = 200
+    PARALLEL_CHUNK_SIZE = 128
+
     def __init__(self):
         self.stats = {
             'total_messages': 0,
             'total_size_bytes': 0,
             'date_range': {'earliest': None, 'latest': None},
             'folders': defaultdict(int),
-            'senders': defaultdict(int),
-            'recipients': defaultdict(int),
+            'senders': Counter(),
+            'recipients': Counter(),
             'has_attachments': 0,
             'by_year': defaultdict(int),
             'by_month': defaultdict(int),
@@ -138,53 +168,93 @@ class MailAnalyzer:
 
         print(f"Analyzing EML directory: {eml_dir}")
 
-        # Calculate total size
-        for eml_file in eml_dir.rglob('*.eml'):
-            self.stats['total_size_bytes'] += eml_file.stat().st_size
+        # Calculate total size from the same scan used for analysis
+        eml_files = list(_scan_eml_files(eml_dir))
+        self.stats['total_size_bytes'] += sum(size for _, _, size in eml_files)
 
         print(f"Total size: {self.stats['total_size_bytes'] / 1024 / 1024:.1f} MB")
 
-        self._analyze_eml_directory(eml_dir)
+        self._analyze_eml_directory(eml_dir, eml_files)
 
         return self.stats
 
-    def _analyze_eml_directory(self, directory: Path):
-        """Analyze all EML files in a directory"""
-        eml_files = list(directory.rglob('*.eml'))
-
-        for i, eml_file in enumerate(eml_files):
-            try:
-                # Get folder from path
-                rel_path = eml_file.relative_to(directory)
-                if len(rel_path.parts) > 1:
-                    folder = '/'.join(rel_path.parts[:-1])
-                else:
-                    folder = 'Inbox'
-                self.stats['folders'][folder] += 1
-
-                # Parse the EML file
-                with open(eml_file, 'rb') as f:
-                    msg = email.message_from_binary_file(f)
-                    self._analyze_message(msg)
+    def _analyze_eml_directory(self, directory: Path,
+                               eml_files: Optional[List[Tuple[str, str, int]]] = None):
+        """Analyze all EML files in a directory (optionally from an existing scan)"""
+        if eml_files is None:
+            eml_files = list(_scan_eml_files(directory))
+
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(eml_files) >= self.PARALLEL_MIN_FILES:
+            # Parsing is CPU-bound; workers return per-message summaries
+            # that are merged here in file order
+            paths = [eml_file for eml_file, _, _ in eml_files]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                summaries = executor.map(summarize_eml_file, paths,
+                                         chunksize=self.PARALLEL_CHUNK_SIZE)
+                self._collect(eml_files, summaries)
+        else:
+            self._collect(eml_files, (summarize_eml_file(eml_file) for eml_file, _, _ in eml_files))
 
-                self.stats['total_messages'] += 1
+    def _collect(self, eml_files: List[Tuple[str, str, int]], summaries):
+        """Merge message summaries into stats alongside each file's folder"""
+        for i, ((_, folder, _), summary) in enumerate(zip(eml_files, summaries)):
+            # Top-level files have no folder
+            self.stats['folders'][folder or 'Inbox'] += 1
 
-                if (i + 1) % 1000 == 0:
-                    print(f"  Analyzed {i + 1}/{len(eml_files)} messages...")
+            # Malformed messages still count, but contribute no other stats
+            if summary is not None:
+                self._record_message(summary)
+            self.stats['total_messages'] += 1
 
-            except Exception as e:
-                # Skip malformed messages
-                self.stats['total_messages'] += 1
-                continue
+            if (i + 1) % 1000 == 0:
+                print(f"  Analyzed {i + 1}/{len(eml_files)} messages...")
 
     def _analyze_message(self, msg):
         """Extract stats from a single email message"""
+        self._record_message(self._summarize_message(msg))
+
+    @staticmethod
+    def _summarize_message(msg) -> Tuple[Optional[datetime], str, List[str], bool]:
+        """Extract (date, sender, recipients, has_attachment) from a message"""
         # Date
+        msg_date = None
         date_str = msg.get('Date')
         if date_str:
             try:
                 msg_date = parsedate_to_datetime(date_str)
+            except Exception:
+                pass
+
+        # Sender (first mailbox in From)
+        sender = ''
+        for _, addr in getaddresses(msg.get_all('From', [])):
+            addr = addr.lower().strip()
+            if addr:
+                sender = addr
+                break
+
+        # Recipients; getaddresses handles quoted names containing commas and group syntax
+        recipients = [addr.lower().strip()
+                      for _, addr in getaddresses(msg.get_all('To', []) + msg.get_all('Cc', []))
+                      if addr.strip()]
 
+        # Attachments
+        has_attachment = False
+        if msg.is_multipart():
+            for part in msg.walk():
+                if part.get_content_disposition() == 'attachment':
+                    has_attachment = True
+                    break
+
+        return msg_date, sender, recipients, has_attachment
+
+    def _record_message(self, summary: Tuple[Optional[datetime], str, List[str], bool]):
+        """Add a message summary to the running stats"""
+        msg_date, sender, recipients, has_attachment = summary
+
+        if msg_date is not None:
+            try:
                 if self.stats['date_range']['earliest'] is None:
                     self.stats['date_range']['earliest'] = msg_date
                     self.stats['date_range']['latest'] = msg_date
@@ -200,34 +270,13 @@ class MailAnalyzer:
             except Exception:
                 pass
 
-        # Sender
-        sender = msg.get('From', '')
         if sender:
-            # Extract email address
-            if '<' in sender:
-                sender = sender.split('<')[1].split('>')[0]
-            sender = sender.lower().strip()
-            if sender:
-                self.stats['senders'][sender] += 1
-
-        # Recipients
-        for header in ['To', 'Cc']:
-            recipients = msg.get(header, '')
-            if recipients:
-                for recip in recipients.split(','):
-                    recip = recip.strip()
-                    if '<' in recip:
-                        recip = recip.split('<')[1].split('>')[0]
-                    recip = recip.lower().strip()
-                    if recip:
-                        self.stats['recipients'][recip] += 1
+            self.stats['senders'][sender] += 1
 
-        # Attachments
-        if msg.is_multipart():
-            for part in msg.walk():
-                if part.get_content_disposition() == 'attachment':
-                    self.stats['has_attachments'] += 1
-                    break
+        self.stats['recipients'].update(recipients)
+
+        if has_attachment:
+            self.stats['has_attachments'] += 1
 
     def print_report(self):
         """Print analysis report"""
@@ -253,15 +302,14 @@ class MailAnalyzer:
 
         if self.stats['by_year']:
             print(f"\nMessages by year:")
-            for year in sorted(self.stats['by_year'].keys()):
-                count = self.stats['by_year'][year]
-                bar = '#' * min(50, int(count / max(self.stats['by_year'].values()) * 50))
+            peak = max(self.stats['by_year'].values())
+            for year, count in sorted(self.stats['by_year'].items()):
+                bar = HISTOGRAM_BAR[:count * 50 // peak]
                 print(f"  {year}: {count:>6,} {bar}")
 
         if self.stats['senders']:
             print(f"\nTop senders:")
-            sorted_senders = sorted(self.stats['senders'].items(), key=lambda x: -x[1])
-            for sender, count in sorted_senders[:5]:
+            for sender, count in self.stats['senders'].most_common(5):
                 print(f"  {sender}: {count:,}")
 
         if self.stats['has_attachments']:
@@ -293,12 +341,25 @@ class MailAnalyzer:
             },
             'folders': dict(self.stats['folders']),
             'messages_by_year': dict(self.stats['by_year']),
-            'top_senders': dict(sorted(self.stats['senders'].items(), key=lambda x: -x[1])[:20]),
+            'top_senders': dict(self.stats['senders'].most_common(20)),
             'messages_with_attachments': self.stats['has_attachments'],
         }
         return json.dumps(output, indent=2)
 
 
+def summarize_eml_file(eml_path: str) -> Optional[Tuple[Optional[datetime], str, List[str], bool]]:
+    """
+    Parse one EML file into a message summary, or None if it is malformed.
+
+    Module-level so it can be pickled to ProcessPoolExecutor workers.
+    """
+    try:
+        with open(eml_path, 'rb') as f:
+            return MailAnalyzer._summarize_message(email.message_from_binary_file(f))
+    except Exception:
+        return None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Analyze PST/EML/MBOX files before migration',
@@ -342,18 +403,17 @@ Examples:
         else:
             # Try to detect by content
             with open(path, 'rb') as f:
-                header = f.read(100)
-                if b'!BDN' in header:
+                header = f.read(5)
+                if header[:4] == b'!BDN':  # PST signature at offset 0
                     analyzer.analyze_pst(str(path))
-                elif b'From ' in header[:5]:
+                elif header == b'From ':
                     analyzer.analyze_mbox(str(path))
                 else:
                     print(f"Error: Unknown file format: {path}")
                     sys.exit(1)
     else:
         # Directory
-        eml_files = list(path.rglob('*.eml'))
-        if eml_files:
+        if next(_scan_eml_files(path), None):
             analyzer.analyze_eml_directory(str(path))
         else:
             print(f"Error: No EML files found in {path}")
@@ -24,13 +24,24 @@ Usage:
 import os
 import sys
 import argparse
+import json
 import subprocess
+import mmap
 import shutil
+import stat
 import time
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
+
+
+# Chunk size for the non-mmap MBOX message count
+MBOX_READ_CHUNK_SIZE = 1024 * 1024
+
+# GYB progress lines, e.g. "restored 1200 messages" / "3 errors"
+_GYB_UPLOADED_RE = re.compile(r'(\d+)\s*(?:message|email|restored)', re.IGNORECASE)
+_GYB_FAILED_RE = re.compile(r'(\d+)\s*(?:error|failed)', re.IGNORECASE)
 
 
 class MigrationStats:
@@ -55,7 +66,8 @@ class MigrationStats:
         if not self.start_time or not self.end_time:
             return "N/A"
         delta = self.end_time - self.start_time
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
+        # Whole seconds straight from the timedelta fields (no float round-trip)
+        hours, remainder = divmod(delta.days * 86400 + delta.seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
         if hours > 0:
             return f"{hours}h {minutes}m {seconds}s"
@@ -95,43 +107,54 @@ def find_executable(name: str, custom_path: Optional[str] = None) -> Optional[st
     return None
 
 
-def detect_input_format(path: str) -> Tuple[str, str]:
+def detect_input_format(path: str,
+                        mail_files: Optional[Dict[str, Tuple[str, ...]]] = None) -> Tuple[str, str]:
     """
     Detect input format based on file extension or directory contents.
 
+    Args:
+        path: Input file or directory
+        mail_files: _scan_mail_tree() result for path, if already scanned
+
     Returns:
         Tuple of (format, description) where format is 'pst', 'eml', 'mbox', or 'eml_dir'
     """
     path = Path(path)
 
-    if not path.exists():
+    # One stat() answers exists / is_file / is_dir and gives the size
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Input path does not exist: {path}")
 
-    if path.is_file():
+    if stat.S_ISREG(st.st_mode):
+        size_mb = st.st_size / 1024 / 1024
         ext = path.suffix.lower()
         if ext == '.pst':
-            return 'pst', f"PST file ({path.stat().st_size / 1024 / 1024:.1f} MB)"
+            return 'pst', f"PST file ({size_mb:.1f} MB)"
         elif ext == '.eml':
             return 'eml', "Single EML file"
         elif ext == '.mbox':
-            return 'mbox', f"MBOX file ({path.stat().st_size / 1024 / 1024:.1f} MB)"
+            return 'mbox', f"MBOX file ({size_mb:.1f} MB)"
         else:
             # Try to detect by content
             with open(path, 'rb') as f:
-                header = f.read(100)
-                if b'!BDN' in header:  # PST magic bytes
-                    return 'pst', f"PST file ({path.stat().st_size / 1024 / 1024:.1f} MB)"
-                elif b'From ' in header[:5]:  # MBOX format
-                    return 'mbox', f"MBOX file ({path.stat().st_size / 1024 / 1024:.1f} MB)"
+                header = f.read(5)
+                if header[:4] == b'!BDN':  # PST signature at offset 0
+                    return 'pst', f"PST file ({size_mb:.1f} MB)"
+                elif header == b'From ':  # MBOX format
+                    return 'mbox', f"MBOX file ({size_mb:.1f} MB)"
             raise ValueError(f"Unknown file format: {path}")
 
-    elif path.is_dir():
+    elif stat.S_ISDIR(st.st_mode):
         # Check if directory contains EML files
-        eml_files = list(path.rglob('*.eml'))
+        if mail_files is None:
+            mail_files = _scan_mail_tree(path)
+        eml_files = mail_files['eml']
         if eml_files:
             return 'eml_dir', f"Directory with {len(eml_files)} EML files"
 
-        mbox_files = list(path.rglob('*.mbox'))
+        mbox_files = mail_files['mbox']
         if mbox_files:
             return 'mbox_dir', f"Directory with {len(mbox_files)} MBOX files"
 
@@ -140,37 +163,143 @@ def detect_input_format(path: str) -> Tuple[str, str]:
     raise ValueError(f"Invalid input path: {path}")
 
 
-def count_eml_files(directory: Path) -> int:
-    """Count EML files in a directory recursively"""
-    return len(list(directory.rglob('*.eml')))
-
+def _scan_mail_tree(directory: Path) -> Dict[str, Tuple[str, ...]]:
+    """
+    Return {'eml': paths, 'mbox': paths} for every mail file under directory.
 
-def count_mbox_files(directory: Path) -> int:
-    """Count MBOX files in a directory recursively"""
-    return len(list(directory.rglob('*.mbox')))
+    main() walks the input once and passes the result on, so format
+    detection, counting and the dry-run upload share a single traversal.
+    """
+    found = {'eml': [], 'mbox': []}
+    pending = [str(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Symlinked directories are not followed (same as GYB's os.walk)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('.eml'):
+                        if entry.is_file():
+                            found['eml'].append(entry.path)
+                    elif entry.name.endswith('.mbox'):
+                        if entry.is_file():
+                            found['mbox'].append(entry.path)
+        except OSError:
+            continue
+    return {kind: tuple(paths) for kind, paths in found.items()}
+
+
+def count_eml_files(directory: Path, mail_files: Optional[Dict[str, Tuple[str, ...]]] = None) -> int:
+    """Count EML files in a directory recursively, reusing mail_files if already scanned"""
+    if mail_files is None:
+        mail_files = _scan_mail_tree(directory)
+    return len(mail_files['eml'])
+
+
+def count_mbox_files(directory: Path, mail_files: Optional[Dict[str, Tuple[str, ...]]] = None) -> int:
+    """Count MBOX files in a directory recursively, reusing mail_files if already scanned"""
+    if mail_files is None:
+        mail_files = _scan_mail_tree(directory)
+    return len(mail_files['mbox'])
 
 
 def count_messages_in_mbox(mbox_path: Path) -> int:
     """Count messages in an MBOX file by counting 'From ' lines"""
-    count = 0
     try:
         with open(mbox_path, 'rb') as f:
-            for line in f:
-                if line.startswith(b'From '):
-                    count += 1
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    # C-level find() over the mapped file: one Python step per
+                    # message rather than one per line
+                    count = 1 if m[:5] == b'From ' else 0
+                    pos = m.find(b'\nFrom ')
+                    while pos != -1:
+                        count += 1
+                        pos = m.find(b'\nFrom ', pos + 1)
+                    return count
+            except (ValueError, OverflowError, OSError):
+                # Empty file, or too large to map (32-bit): count in chunks
+                return _count_from_lines_chunked(f)
     except Exception:
-        pass
-    return count
+        return 0
+
+
+def _count_from_lines_chunked(f) -> int:
+    """Count 'From ' line starts reading 1 MB at a time, carrying overlap between chunks"""
+    f.seek(0)
+    # Treat the file start like a preceding newline
+    tail = b'\n'
+    count = 0
+    while True:
+        chunk = f.read(MBOX_READ_CHUNK_SIZE)
+        if not chunk:
+            return count
+        data = tail + chunk
+        count += data.count(b'\nFrom ')
+        # Keep enough bytes for a separator split across the boundary
+        tail = data[-5:]
 
 
 def count_all_mbox_messages(directory: Path) -> int:
     """Count total messages across all MBOX files in a directory"""
     total = 0
-    for mbox_file in directory.rglob('*.mbox'):
-        total += count_messages_in_mbox(mbox_file)
+    for mbox_file in _scan_mail_tree(directory)['mbox']:
+        total += count_messages_in_mbox(Path(mbox_file))
     return total
 
 
+def conversion_manifest_path(output_dir: str) -> Path:
+    """Manifest file for a conversion, kept beside output_dir so GYB never reads it"""
+    output_dir = Path(output_dir)
+    return output_dir.with_name(output_dir.name + '.manifest.json')
+
+
+def write_conversion_manifest(pst_path: str, output_dir: str, mbox_count: int):
+    """Record a finished readpst conversion so --resume can trust output_dir"""
+    pst_stat = Path(pst_path).stat()
+    manifest = {
+        'pst_path': str(Path(pst_path).resolve()),
+        'pst_size': pst_stat.st_size,
+        'pst_mtime_ns': pst_stat.st_mtime_ns,
+        'mbox_files': mbox_count,
+    }
+    with open(conversion_manifest_path(output_dir), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def read_conversion_manifest(pst_path: str, output_dir: str) -> Optional[int]:
+    """
+    Return the MBOX file count of a completed conversion of this PST.
+
+    Returns None if there is no manifest (conversion never finished) or it
+    was written for a different or since-modified PST.
+    """
+    try:
+        with open(conversion_manifest_path(output_dir)) as f:
+            manifest = json.load(f)
+        pst_stat = Path(pst_path).stat()
+    except (OSError, ValueError):
+        return None
+
+    if (manifest.get('pst_path') != str(Path(pst_path).resolve())
+            or manifest.get('pst_size') != pst_stat.st_size
+            or manifest.get('pst_mtime_ns') != pst_stat.st_mtime_ns):
+        return None
+    return manifest.get('mbox_files')
+
+
+def remove_converted_output(output_dir: str):
+    """Delete converted files and their manifest"""
+    if Path(output_dir).exists():
+        shutil.rmtree(output_dir)
+    try:
+        conversion_manifest_path(output_dir).unlink()
+    except FileNotFoundError:
+        pass
+
+
 def convert_pst_to_eml(pst_path: str, output_dir: str, readpst_path: str,
                         dry_run: bool = False) -> Tuple[bool, int]:
     """
@@ -181,18 +310,19 @@ def convert_pst_to_eml(pst_path: str, output_dir: str, readpst_path: str,
     """
     pst_path = Path(pst_path)
     output_dir = Path(output_dir)
+    pst_size = pst_path.stat().st_size
 
     print(f"\n{'=' * 60}")
     print("PST CONVERSION")
     print('=' * 60)
     print(f"Input:  {pst_path}")
     print(f"Output: {output_dir}")
-    print(f"Size:   {pst_path.stat().st_size / 1024 / 1024:.1f} MB")
+    print(f"Size:   {pst_size / 1024 / 1024:.1f} MB")
 
     if dry_run:
         print("\n[DRY RUN] Would convert PST to EML")
         # Estimate message count (rough heuristic: ~50KB per message average)
-        estimated = int(pst_path.stat().st_size / 50000)
+        estimated = int(pst_size / 50000)
         print(f"[DRY RUN] Estimated messages: ~{estimated}")
         return True, estimated
 
@@ -243,12 +373,15 @@ def convert_pst_to_eml(pst_path: str, output_dir: str, readpst_path: str,
     print(f"Conversion complete in {elapsed:.1f}s")
     print(f"MBOX files created: {message_count}")
 
+    write_conversion_manifest(str(pst_path), str(output_dir), message_count)
+
     return True, message_count
 
 
 def run_gyb_upload(email: str, local_folder: str, gyb_path: str,
                    action: str = 'restore', label: Optional[str] = None,
-                   dry_run: bool = False) -> Tuple[bool, int, int]:
+                   dry_run: bool = False,
+                   mail_files: Optional[Dict[str, Tuple[str, ...]]] = None) -> Tuple[bool, int, int]:
     """
     Run GYB to upload emails to Gmail.
 
@@ -259,6 +392,7 @@ def run_gyb_upload(email: str, local_folder: str, gyb_path: str,
         action: GYB action ('restore' for EML, 'restore-mbox' for MBOX)
         label: Optional Gmail label to apply
         dry_run: If True, just count files
+        mail_files: _scan_mail_tree() result for local_folder, if already scanned
 
     Returns:
         Tuple of (success, uploaded_count, failed_count)
@@ -276,9 +410,9 @@ def run_gyb_upload(email: str, local_folder: str, gyb_path: str,
         # Count what would be uploaded
         folder = Path(local_folder)
         if action == 'restore':
-            count = count_eml_files(folder)
+            count = count_eml_files(folder, mail_files)
         else:
-            count = len(list(folder.rglob('*.mbox')))
+            count = count_mbox_files(folder, mail_files)
         print(f"\n[DRY RUN] Would upload {count} messages to {email}")
         return True, count, 0
 
@@ -316,13 +450,14 @@ def run_gyb_upload(email: str, local_folder: str, gyb_path: str,
                 print(f"  {line}")
 
                 # Parse GYB output for stats
-                if 'restored' in line.lower() or 'uploaded' in line.lower():
+                lowered = line.lower()
+                if 'restored' in lowered or 'uploaded' in lowered:
                     # Try to extract numbers
-                    match = re.search(r'(\d+)\s*(message|email|restored)', line.lower())
+                    match = _GYB_UPLOADED_RE.search(line)
                     if match:
                         uploaded = int(match.group(1))
-                elif 'error' in line.lower() or 'failed' in line.lower():
-                    match = re.search(r'(\d+)\s*(error|failed)', line.lower())
+                elif 'error' in lowered or 'failed' in lowered:
+                    match = _GYB_FAILED_RE.search(line)
                     if match:
                         failed = int(match.group(1))
 
@@ -447,9 +582,15 @@ Examples:
     print("PST TO GMAIL MIGRATION TOOL")
     print("=" * 60)
 
+    # Walk an input directory once; detection, counting and the dry-run
+    # upload all reuse this scan
+    mail_files = None
+    if os.path.isdir(args.input_path):
+        mail_files = _scan_mail_tree(Path(args.input_path))
+
     # Detect input format
     try:
-        input_format, format_desc = detect_input_format(args.input_path)
+        input_format, format_desc = detect_input_format(args.input_path, mail_files)
         print(f"\nInput detected: {format_desc}")
     except (FileNotFoundError, ValueError) as e:
         print(f"\nError: {e}")
@@ -492,19 +633,24 @@ Examples:
         needs_conversion = True
         upload_path = args.output_dir
         gyb_action = 'restore-mbox'  # PST converts to MBOX format
-        stats.pst_size = Path(args.input_path).stat().st_size
+        stats.pst_size = os.path.getsize(args.input_path)
 
-        # Check if we should skip conversion (resume mode)
+        # Check if we should skip conversion (resume mode). Only a conversion
+        # that finished (and wrote its manifest) for this same PST is reused;
+        # a partial readpst run would otherwise upload an incomplete mailbox.
         if args.resume and Path(args.output_dir).exists():
-            mbox_count = count_mbox_files(Path(args.output_dir))
-            if mbox_count > 0:
-                print(f"\nResume mode: Found {mbox_count} existing MBOX files, skipping conversion")
+            mbox_count = read_conversion_manifest(args.input_path, args.output_dir)
+            if mbox_count:
+                print(f"\nResume mode: Found completed conversion with {mbox_count} MBOX files, skipping conversion")
                 needs_conversion = False
                 stats.messages_found = mbox_count
+            else:
+                print(f"\nResume mode: No completed conversion of this PST in {args.output_dir}, converting again...")
+                remove_converted_output(args.output_dir)
         elif Path(args.output_dir).exists() and not args.resume:
             # Clean up old files when not resuming
             print(f"\nCleaning up previous conversion in {args.output_dir}...")
-            shutil.rmtree(args.output_dir)
+            remove_converted_output(args.output_dir)
 
         if needs_conversion:
             success, count = convert_pst_to_eml(
@@ -521,19 +667,21 @@ Examples:
     elif input_format == 'mbox':
         gyb_action = 'restore-mbox'
         # Rough estimate for MBOX
-        file_size = Path(args.input_path).stat().st_size
+        file_size = os.path.getsize(args.input_path)
         stats.messages_found = int(file_size / 50000)  # Rough estimate
 
     elif input_format == 'eml':
         stats.messages_found = 1
 
     elif input_format == 'eml_dir':
-        stats.messages_found = count_eml_files(Path(args.input_path))
+        stats.messages_found = count_eml_files(Path(args.input_path), mail_files)
 
     elif input_format == 'mbox_dir':
         gyb_action = 'restore-mbox'
-        mbox_files = list(Path(args.input_path).rglob('*.mbox'))
-        stats.messages_found = len(mbox_files)
+        # Same rough estimate as a single MBOX, over the total size of all of them
+        mbox_files = mail_files['mbox']
+        total_size = sum(os.path.getsize(mbox_file) for mbox_file in mbox_files)
+        stats.messages_found = int(total_size / 50000)  # Rough estimate
 
     # Upload to Gmail
     success, uploaded, failed = run_gyb_upload(
@@ -542,7 +690,9 @@ Examples:
         gyb_path,
         action=gyb_action,
         label=args.label,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        # A PST uploads from output_dir, which readpst has just written
+        mail_files=mail_files if upload_path == args.input_path else None
     )
 
     stats.messages_uploaded = uploaded
@@ -552,7 +702,7 @@ Examples:
     if input_format == 'pst' and not args.keep_converted and not args.dry_run:
         if Path(args.output_dir).exists():
             print(f"\nCleaning up converted files in {args.output_dir}")
-            shutil.rmtree(args.output_dir)
+            remove_converted_output(args.output_dir)
 
     stats.finish()
     print_summary(stats, dry_run=args.dry_run)
@@ -74,6 +74,62 @@ class TestInputFormatDetection:
             os.unlink(temp_path)
 
 
+class TestMboxMessageCount:
+    """Tests for count_messages_in_mbox()"""
+
+    def test_count_sample_mbox(self):
+        """Should count one message per 'From ' separator line"""
+        from pst_to_gmail import count_messages_in_mbox
+        assert count_messages_in_mbox(TEST_DATA_DIR / "sample.mbox") == 2
+
+    def test_chunked_count_matches(self, tmp_path, monkeypatch):
+        """Chunked fallback should count separators split across chunk boundaries"""
+        import pst_to_gmail
+        monkeypatch.setattr(pst_to_gmail, "MBOX_READ_CHUNK_SIZE", 3)
+        mbox_path = tmp_path / "test.mbox"
+        mbox_path.write_bytes(b"From a\nbody From x\n\nFrom b\nFrom c\n")
+
+        with open(mbox_path, "rb") as f:
+            assert pst_to_gmail._count_from_lines_chunked(f) == 3
+        assert pst_to_gmail.count_messages_in_mbox(mbox_path) == 3
+
+    def test_empty_mbox(self, tmp_path):
+        """Empty files cannot be mapped and should count as zero"""
+        from pst_to_gmail import count_messages_in_mbox
+        mbox_path = tmp_path / "empty.mbox"
+        mbox_path.write_bytes(b"")
+        assert count_messages_in_mbox(mbox_path) == 0
+
+
+class TestConversionManifest:
+    """Tests for the --resume conversion manifest"""
+
+    def test_manifest_round_trip(self, tmp_path):
+        """A manifest written for a PST should be read back for that PST"""
+        from pst_to_gmail import write_conversion_manifest, read_conversion_manifest
+        pst_path = tmp_path / "backup.pst"
+        pst_path.write_bytes(b"!BDN" + b"\0" * 100)
+        output_dir = tmp_path / "converted"
+        output_dir.mkdir()
+
+        assert read_conversion_manifest(str(pst_path), str(output_dir)) is None
+        write_conversion_manifest(str(pst_path), str(output_dir), 7)
+        assert read_conversion_manifest(str(pst_path), str(output_dir)) == 7
+        # Kept outside output_dir so GYB never tries to import it
+        assert not list(output_dir.iterdir())
+
+    def test_manifest_rejects_changed_pst(self, tmp_path):
+        """A manifest should not be trusted once the PST has changed"""
+        from pst_to_gmail import write_conversion_manifest, read_conversion_manifest
+        pst_path = tmp_path / "backup.pst"
+        pst_path.write_bytes(b"!BDN" + b"\0" * 100)
+        output_dir = tmp_path / "converted"
+        write_conversion_manifest(str(pst_path), str(output_dir), 7)
+
+        pst_path.write_bytes(b"!BDN" + b"\0" * 200)
+        assert read_conversion_manifest(str(pst_path), str(output_dir)) is None
+
+
 class TestFindExecutable:
     """Tests for find_executable()"""
 
@@ -195,6 +251,48 @@ class TestEMLValidator:
         eml_count = len(list(TEST_DATA_DIR.glob("*.eml")))
         assert validator.stats["total"] == eml_count
 
+    def test_parallel_validation_matches_serial(self, monkeypatch):
+        """Worker pool should give the same results as serial validation"""
+        serial = EMLValidator()
+        serial.validate_directory(str(TEST_DATA_DIR), sample=0)
+
+        import eml_validator
+        monkeypatch.setattr(eml_validator.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(EMLValidator, "PARALLEL_MIN_FILES", 1)
+        parallel = EMLValidator()
+        parallel.validate_directory(str(TEST_DATA_DIR), sample=0)
+
+        assert parallel.stats == serial.stats
+        assert [(r.path, r.errors, r.warnings) for r in parallel.results] == \
+            [(r.path, r.errors, r.warnings) for r in serial.results]
+
+    def test_state_db_resume(self, tmp_path):
+        """A rerun with the same state DB should reload results instead of revalidating"""
+        state_db = str(tmp_path / "state.db")
+        first = EMLValidator(state_db=state_db)
+        first.validate_directory(str(TEST_DATA_DIR), sample=0)
+
+        resumed = EMLValidator(state_db=state_db)
+        assert resumed.stats == first.stats
+        assert len(resumed.validated_paths) == first.stats["total"]
+
+        resumed.validate_directory(str(TEST_DATA_DIR), sample=0)
+        assert resumed.stats == first.stats
+
+    def test_8bit_message_id(self, tmp_path):
+        """A raw 8-bit Message-ID should not abort the directory run"""
+        headers = b"From: a@example.com\r\nTo: b@example.com\r\nSubject: Test\r\n" \
+                  b"Date: Mon, 1 Jan 2024 10:00:00 +0000\r\n"
+        (tmp_path / "good.eml").write_bytes(headers + b"Message-ID: <good@example.com>\r\n\r\nBody\r\n")
+        (tmp_path / "bad.eml").write_bytes(headers + b"Message-ID: <x\xe9y@example.com>\r\n\r\nBody\r\n")
+        (tmp_path / "bad2.eml").write_bytes(headers + b"Message-ID: <x\xe9y@example.com>\r\n\r\nBody\r\n")
+
+        validator = EMLValidator()
+        validator.validate_directory(str(tmp_path), sample=0)
+
+        assert validator.stats["total"] == 3
+        assert validator.stats["duplicates"] == 1
+
     def test_mbox_validation(self):
         """Should validate MBOX files"""
         validator = EMLValidator()
@@ -256,6 +354,20 @@ class TestMailAnalyzer:
         assert "total_size_bytes" in data
         assert "date_range" in data
 
+    def test_parallel_analysis_matches_serial(self, monkeypatch):
+        """Worker pool should give the same stats as serial analysis"""
+        serial = MailAnalyzer()
+        serial.analyze_eml_directory(str(TEST_DATA_DIR))
+
+        import pst_analyzer
+        monkeypatch.setattr(pst_analyzer.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(MailAnalyzer, "PARALLEL_MIN_FILES", 1)
+        parallel = MailAnalyzer()
+        parallel.analyze_eml_directory(str(TEST_DATA_DIR))
+
+        assert parallel.to_json() == serial.to_json()
+        assert parallel.stats["recipients"] == serial.stats["recipients"]
+
     @pytest.mark.skipif(
         shutil.which("readpst") is None,
         reason="readpst not installed"